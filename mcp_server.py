@@ -14,7 +14,7 @@ Signal-first pipeline (identical to the chaos proxy):
 5. Entropy + coherence as secondary metrics
 6. Hazard gating (collapse detection) on every retrieval
 
-Tools exposed (21 total):
+Tools exposed (22 total):
   Indexing & Monitoring:
     • ingest_repo          – stream-ingest repo into Valkey (text + sigs + chaos)
     • get_index_stats      – Valkey db health + doc count
@@ -34,6 +34,7 @@ Tools exposed (21 total):
 
   Chaos Detection:
     • analyze_code_chaos   – full ChaosResult per file
+    • batch_analyze_code_chaos – ChaosResult for many files, one pipelined fetch
     • batch_chaos_scan     – GPU-style batch validation
     • predict_structural_ejection – maintainability forecast
     • visualize_manifold_trajectory – 4-panel dashboard
@@ -54,16 +55,22 @@ For quick start, see: README.md
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
+import gc
 import hashlib
+import heapq
 import json
 import os
 import re
 import sys
+import threading
 import time
+import orjson
 import zstandard as zstd
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import Annotated, Dict, List, Optional, Any
+from typing import Annotated, Dict, List, Optional, Any, Tuple
 
 from pydantic import Field
 
@@ -90,6 +97,10 @@ if _SRC_DIR.exists() and str(_SRC_DIR) not in sys.path:
 # MCP server init (lightweight – no torch / numpy yet)
 # ---------------------------------------------------------------------------
 from mcp.server.fastmcp import FastMCP
+from src.manifold.chaos_codec import (
+    decode_chaos as _decode_chaos,
+    encode_chaos as _encode_chaos,
+)
 
 mcp = FastMCP("SymbolicChaosProxy")
 
@@ -116,7 +127,7 @@ def _get_index_root() -> Path:
         meta_raw = v.r.get(META_KEY)
         if meta_raw:
             try:
-                meta = json.loads(meta_raw)
+                meta = orjson.loads(meta_raw)
                 root = meta.get("root")
                 if root:
                     return Path(root)
@@ -125,6 +136,21 @@ def _get_index_root() -> Path:
     return WORKSPACE_ROOT
 
 
+def _chaos_ranked(v) -> bool:
+    """True when CHAOS_ZSET_KEY covers every stored chaos profile.
+
+    Indexes built before the ranking existed only hold profiles in the file
+    hashes, so callers must fall back to scanning those.
+    """
+    meta_raw = v.r.get(META_KEY)
+    if not meta_raw:
+        return False
+    try:
+        return bool(orjson.loads(meta_raw).get("chaos_ranked"))
+    except orjson.JSONDecodeError:
+        return False
+
+
 def _get_ast_analyzer():
     """Get or create the AST dependency analyzer singleton.
 
@@ -174,10 +200,33 @@ def invalidate_ast_cache():
 FILE_HASH_PREFIX = "manifold:file:"
 META_KEY = "manifold:meta:ingest"
 FILE_LIST_KEY = "manifold:file_list"
+# rel path -> chaos_score, so the riskiest files come back without a scan
+CHAOS_ZSET_KEY = "manifold:chaos:zset"
+
+# Compiled once; search_by_structure calls this per indexed file
+_SIG_RE = re.compile(r"c([\d.]+)_s([\d.]+)_e([\d.]+)").match
+_GLOBSTAR_RE = re.compile(r"\*{2,}")
+_SAFE_NAME_RE = re.compile(r"[^\w.]")
+
+# Symbolic states indexed by the visualizer's state code (0, 1, 2)
+_STATE_LABELS = ("LOW_FLUCTUATION", "OSCILLATION", "PERSISTENT_HIGH")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_query(query: str, case_sensitive: bool) -> re.Pattern:
+    """Compile a search_code query, falling back to a literal match."""
+    flags = 0 if case_sensitive else re.IGNORECASE
+    try:
+        return re.compile(query, flags)
+    except re.error:
+        return re.compile(re.escape(query), flags)
+
 
 # Zstandard compressor
 _zctx = zstd.ZstdCompressor(level=3)
 _zdctx = zstd.ZstdDecompressor()
+# Every zstd frame starts with this magic; anything else was stored raw
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
 
 
 def _compress(data: bytes) -> bytes:
@@ -188,6 +237,110 @@ def _decompress(data: bytes) -> bytes:
     return _zdctx.decompress(data)
 
 
+def _unpack(raw: bytes) -> bytes:
+    """Return stored bytes, decompressing only when they carry the zstd magic."""
+    if raw[:4] == _ZSTD_MAGIC:
+        return _zdctx.decompress(raw)
+    return raw
+
+
+def _to_valkey_glob(pattern: str) -> Optional[str]:
+    """Translate an fnmatch pattern to a Valkey MATCH glob.
+
+    Returns None when the pattern has no faithful Valkey equivalent, in which
+    case callers should filter client-side with fnmatch.
+    """
+    # Backslash escapes and "[^" negation mean different things to Valkey
+    if any(tok in pattern for tok in ("\\", "[]", "[!]", "[^")):
+        return None
+    # fnmatch's "*" already crosses "/", so "**" is just a redundant "*"
+    return _GLOBSTAR_RE.sub("*", pattern).replace("[!", "[^")
+
+
+def _glob_pushdown(*patterns: str):
+    """Split fnmatch filters into one SCAN MATCH glob plus a client-side predicate.
+
+    The first pattern Valkey can express is pushed server-side; any others are
+    returned as a ``keep(rel)`` predicate (None when nothing is left to check).
+    """
+    match = "*"
+    rest = []
+    for pat in patterns:
+        if pat == "*":
+            continue
+        vglob = _to_valkey_glob(pat)
+        if match == "*" and vglob is not None:
+            match = vglob
+        else:
+            rest.append(pat)
+    if not rest:
+        return match, None
+    return match, lambda rel: all(fnmatch(rel, p) for p in rest)
+
+
+def _unpack_head(raw: bytes, max_bytes: int) -> bytes:
+    """Like _unpack, but stop decompressing after *max_bytes* of output."""
+    if raw[:4] != _ZSTD_MAGIC:
+        return raw[:max_bytes]
+    with _zdctx.stream_reader(raw) as reader:
+        return reader.read(max_bytes)
+
+
+def _decode_doc(raw: bytes) -> str:
+    """Decode a stored ``doc`` field (zstd-compressed text, or a raw fallback)."""
+    return _unpack(raw).decode("utf-8", errors="replace")
+
+
+def _hmget_batch(keys, fields) -> List[List[Optional[bytes]]]:
+    """HMGET *fields* for every key in a single pipelined round trip."""
+    pipe = _get_valkey_wm().raw_r.pipeline(transaction=False)
+    for key in keys:
+        pipe.hmget(key, fields)
+    return pipe.execute()
+
+
+def _fetch_doc(path: str) -> Optional[str]:
+    """Return the decoded indexed content of *path*, or None if not indexed."""
+    raw = _get_valkey_wm().raw_r.hget(f"{FILE_HASH_PREFIX}{path}", "doc")
+    return _decode_doc(raw) if raw else None
+
+
+def _fetch_chaos(path: str) -> Optional[Dict]:
+    """Return the stored chaos profile of *path*, or None if there is none."""
+    raw = _get_valkey_wm().raw_r.hget(f"{FILE_HASH_PREFIX}{path}", "chaos")
+    return _decode_chaos(raw) if raw else None
+
+
+def _scan_file_fields(match, fields, keep=None, count=5000, batch_size=1000):
+    """Yield ``(rel, values)`` for file hashes whose path matches the Valkey glob.
+
+    SCAN runs with MATCH and a large COUNT; the requested hash fields are
+    fetched with one pipelined HMGET burst per *batch_size* keys.
+    """
+    v = _get_valkey_wm()
+    prefix_len = len(FILE_HASH_PREFIX)
+    keys = []
+    rels = []
+
+    def _flush():
+        return zip(rels, _hmget_batch(keys, fields))
+
+    for key in v.raw_r.scan_iter(
+        f"{FILE_HASH_PREFIX}{match}".encode("utf-8"), count=count
+    ):
+        rel = key[prefix_len:].decode("utf-8", errors="replace")
+        if keep is not None and not keep(rel):
+            continue
+        keys.append(key)
+        rels.append(rel)
+        if len(keys) >= batch_size:
+            yield from _flush()
+            keys.clear()
+            rels.clear()
+    if keys:
+        yield from _flush()
+
+
 EXCLUDE_DIRS = {
     ".git",
     "__pycache__",
@@ -274,9 +427,15 @@ def _should_skip(path: Path) -> bool:
     return False
 
 
-def _is_text(path: Path) -> bool:
-    """Everything that passes _should_skip is text unless it's a known binary extension."""
-    return path.suffix.lower() not in BINARY_EXTENSIONS
+def _is_text(path: Path, raw: bytes = b"") -> bool:
+    """Everything that passes _should_skip is text unless it's a known binary extension.
+
+    When the file's leading bytes are supplied, a NUL byte in the first 8 KB
+    (a C-level memchr via bytes.find) also marks it as binary.
+    """
+    if path.suffix.lower() in BINARY_EXTENSIONS:
+        return False
+    return raw.find(b"\0", 0, 8192) < 0
 
 
 def _read_capped(path: Path, cap: int) -> bytes:
@@ -284,6 +443,29 @@ def _read_capped(path: Path, cap: int) -> bytes:
         return f.read(cap)
 
 
+def _ingest_rel(path: Path, target: Path) -> str:
+    """Index key of *path*: relative to the ingest root where possible."""
+    try:
+        return os.path.relpath(path, target)
+    except ValueError:
+        return str(path)
+
+
+def _chaos_flag(
+    rel: str, path: Path, is_text: bool, compute_chaos: bool, lite: bool
+) -> str:
+    """Stamp marker for whether ingest scores *path* for chaos: ``c`` or ``-``."""
+    if not compute_chaos:
+        return "-"
+    if lite and (
+        "test" in rel.lower()
+        or path.suffix.lower() in {".md", ".txt", ".rst"}
+        or not is_text
+    ):
+        return "-"
+    return "c"
+
+
 # ---------------------------------------------------------------------------
 # Signature helpers (lazy-loaded) – from original prototype
 # ---------------------------------------------------------------------------
@@ -318,16 +500,24 @@ def _compute_sig(data: bytes, precision: int = 3) -> Optional[str]:
 # ---------------------------------------------------------------------------
 # Core chaos helper (mirrors three_body_demo.py + gpu_batch_validation.py)
 # ---------------------------------------------------------------------------
+# The chaos profile only looks at a file's first _CHAOS_HEAD_CHARS characters;
+# at most 4 UTF-8 bytes each, so this many leading bytes always cover them.
+_CHAOS_HEAD_CHARS = 4096
+_CHAOS_HEAD_BYTES = 4 * _CHAOS_HEAD_CHARS
+
+
 def _compute_chaos_result(raw: bytes) -> Optional[Dict]:
     """Run the exact same symbolic pipeline as the 3-body chaos proxy."""
     if len(raw) < 512:
         return None
 
+    # Decode just the head bytes rather than the whole file
+    head = raw[:_CHAOS_HEAD_BYTES].decode("utf-8", errors="replace")
     try:
         from src.manifold.sidecar import encode_text
 
         encoded = encode_text(
-            raw.decode("utf-8", errors="replace")[:4096],
+            head[:_CHAOS_HEAD_CHARS],
             window_bytes=512,
             stride_bytes=384,
             precision=3,
@@ -336,22 +526,19 @@ def _compute_chaos_result(raw: bytes) -> Optional[Dict]:
     except Exception:
         return None
 
-    windows = []
-    for win in encoded.windows:
-        windows.append(
-            {
-                "fluctuation_persistence": win.hazard,
-                "entropy": win.entropy,
-                "coherence": win.coherence,
-                "collapse_detected": win.hazard >= 0.35,
-            }
-        )
-    if not windows:
+    n = len(encoded.windows)
+    if not n:
         return None
 
-    avg_fp = sum(w["fluctuation_persistence"] for w in windows) / len(windows)
-    avg_entropy = sum(w["entropy"] for w in windows) / len(windows)
-    avg_coherence = sum(w["coherence"] for w in windows) / len(windows)
+    # One pass over the windows; fluctuation_persistence is the window hazard
+    sum_fp = sum_entropy = sum_coherence = 0.0
+    for win in encoded.windows:
+        sum_fp += win.hazard
+        sum_entropy += win.entropy
+        sum_coherence += win.coherence
+    avg_fp = sum_fp / n
+    avg_entropy = sum_entropy / n
+    avg_coherence = sum_coherence / n
 
     return {
         "chaos_score": avg_fp,
@@ -360,7 +547,7 @@ def _compute_chaos_result(raw: bytes) -> Optional[Dict]:
         "collapse_risk": (
             "HIGH" if avg_fp >= 0.35 else "MODERATE" if avg_fp >= 0.15 else "LOW"
         ),
-        "windows_analyzed": len(windows),
+        "windows_analyzed": n,
     }
 
 
@@ -388,12 +575,23 @@ def ingest_repo(
             description="Skip full chaos entropy generation on tests, docs, and binaries"
         ),
     ] = False,
+    incremental: Annotated[
+        bool,
+        Field(
+            description="Reuse stored results for files whose mtime and size are unchanged since the last ingest"
+        ),
+    ] = False,
 ) -> str:
     """Full symbolic-dynamics ingest of the repository.
 
     Every file is treated as a dynamical system.
     We extract the structural 'kinetic energy variance' and compute the
     exact chaos score used in the 3-body proxy.
+
+    With *incremental*, files whose ``stamp`` (mtime_ns and size) matches the
+    one recorded by the previous ingest, read under the same byte cap and with
+    the same chaos/lite decision, are not re-read or re-scored; their stored
+    signature and chaos fields still count towards the totals.
     """
     v = _get_valkey_wm()
     if not v.ping():
@@ -411,6 +609,10 @@ def ingest_repo(
         for key in v.r.scan_iter("manifold:*"):
             v.r.delete(key)
 
+    # The chaos ranking stays complete only if it was complete before (or the
+    # index is empty); otherwise batch_chaos_scan keeps scanning file hashes
+    chaos_ranked = not v.r.exists(FILE_LIST_KEY) or _chaos_ranked(v)
+
     text_count = 0
     binary_count = 0
     total_bytes = 0
@@ -434,6 +636,17 @@ def ingest_repo(
     # Track semantic nodes for FAISS embedding
     semantic_nodes: List[Any] = []
 
+    # Previous ingest state: rel -> (stamp, sig, chaos), one pipelined burst
+    previous: Dict[str, List[Optional[bytes]]] = {}
+    if incremental:
+        rels = [_ingest_rel(path, target) for path in all_files]
+        keys = [f"{FILE_HASH_PREFIX}{rel}" for rel in rels]
+        for i in range(0, len(keys), 1000):
+            rows = _hmget_batch(keys[i : i + 1000], ["stamp", "sig", "chaos"])
+            previous.update(zip(rels[i : i + 1000], rows))
+    unchanged = 0
+    unchanged_py: List[Tuple[str, Path]] = []
+
     for path in all_files:
         if not path.is_file():
             continue
@@ -441,13 +654,39 @@ def ingest_repo(
             skipped += 1
             continue
 
-        try:
-            # Strictly constrain ingestion paths to relative structure for absolute system path requests
-            rel = os.path.relpath(path, target)
-        except ValueError:
-            rel = str(path)
+        rel = _ingest_rel(path, target)
 
         try:
+            st = path.stat()
+            raw_stamp = f"{st.st_mtime_ns}:{st.st_size}"
+            prior = previous.get(rel)
+            stamp = prior[0].decode().split(":") if prior and prior[0] else []
+            # Reuse only if the stored fields are what this call would produce:
+            # same file, same bytes read under the cap, same chaos decision
+            if (
+                len(stamp) == 5
+                and ":".join(stamp[:2]) == raw_stamp
+                and int(stamp[2]) == min(st.st_size, max_bytes_per_file)
+                and stamp[4]
+                == _chaos_flag(rel, path, stamp[3] == "t", compute_chaos, lite)
+            ):
+                length, kind = stamp[2:4]
+                unchanged += 1
+                total_bytes += int(length)
+                if kind == "t":
+                    text_count += 1
+                    if path.suffix == ".py":
+                        unchanged_py.append((rel, path))
+                else:
+                    binary_count += 1
+                if prior[1]:
+                    sig_count += 1
+                if prior[2]:
+                    chaos = _decode_chaos(prior[2])
+                    total_chaos += chaos["chaos_score"]
+                    if chaos["collapse_risk"] == "HIGH":
+                        high_risk += 1
+                continue
             raw = _read_capped(path, max_bytes_per_file)
         except Exception as exc:
             errors.append(f"{rel}: {exc}")
@@ -461,7 +700,8 @@ def ingest_repo(
         hash_key = f"{FILE_HASH_PREFIX}{rel}"
         fields = {}
 
-        if _is_text(path):
+        is_text = _is_text(path, raw)
+        if is_text:
             fields["doc"] = _compress(raw)
             text_count += 1
         else:
@@ -471,6 +711,10 @@ def ingest_repo(
             else:
                 fields["doc"] = f"[BINARY sha256={digest} bytes={len(raw)}]"
             binary_count += 1
+        chaos_flag = _chaos_flag(rel, path, is_text, compute_chaos, lite)
+        fields["stamp"] = (
+            f"{raw_stamp}:{len(raw)}:{'t' if is_text else 'b'}:{chaos_flag}"
+        )
 
         pipe.zadd(FILE_LIST_KEY, {rel: len(raw)})
 
@@ -482,28 +726,25 @@ def ingest_repo(
                 sig_count += 1
 
         # Chaos profile (new expansion)
-        if compute_chaos:
-            skip_chaos = False
-            if lite and (
-                "test" in rel.lower()
-                or path.suffix.lower() in {".md", ".txt", ".rst"}
-                or not _is_text(path)
-            ):
-                skip_chaos = True
-
-            if not skip_chaos:
-                chaos = _compute_chaos_result(raw)
-                if chaos:
-                    fields["chaos"] = _compress(json.dumps(chaos).encode("utf-8"))
-                    total_chaos += chaos["chaos_score"]
-                    if chaos["collapse_risk"] == "HIGH":
-                        high_risk += 1
+        if chaos_flag == "c":
+            chaos = _compute_chaos_result(raw)
+            if chaos:
+                fields["chaos"] = _encode_chaos(chaos)
+                pipe.zadd(CHAOS_ZSET_KEY, {rel: chaos["chaos_score"]})
+                total_chaos += chaos["chaos_score"]
+                if chaos["collapse_risk"] == "HIGH":
+                    high_risk += 1
+
+        if "chaos" not in fields:
+            # A profile from an earlier ingest no longer describes this content
+            pipe.hdel(hash_key, "chaos")
+            pipe.zrem(CHAOS_ZSET_KEY, rel)
 
         if fields:
             pipe.hset(hash_key, mapping=fields)
 
         # AST Semantic Extraction for FAISS
-        if path.suffix == ".py" and _is_text(path) and len(raw) < 1_000_000:
+        if path.suffix == ".py" and is_text and len(raw) < 1_000_000:
             try:
                 from src.manifold.semantic import extract_semantic_nodes
 
@@ -520,6 +761,20 @@ def ingest_repo(
 
     pipe.execute()
 
+    # The semantic index covers every Python file, so a rebuild needs the nodes
+    # of the unchanged ones too; when no Python file changed the stored index stands
+    if semantic_nodes:
+        from src.manifold.semantic import extract_semantic_nodes
+
+        for rel, path in unchanged_py:
+            try:
+                raw = _read_capped(path, max_bytes_per_file)
+                if len(raw) < 1_000_000:
+                    content_str = raw.decode("utf-8", errors="replace")
+                    semantic_nodes.extend(extract_semantic_nodes(rel, content_str))
+            except Exception:
+                pass
+
     # Build and cache Semantic Index
     semantic_indexed = 0
     if semantic_nodes:
@@ -548,8 +803,9 @@ def ingest_repo(
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "avg_chaos": avg_chaos,
         "high_risk_files": high_risk,
+        "chaos_ranked": chaos_ranked,
     }
-    v.r.set(META_KEY, json.dumps(meta))
+    v.r.set(META_KEY, orjson.dumps(meta))
 
     err_report = ""
     if errors:
@@ -563,6 +819,7 @@ def ingest_repo(
         f"  Signatures : {sig_count}\n"
         f"  Semantic fn: {semantic_indexed}\n"
         f"  Skipped    : {skipped}\n"
+        f"  Unchanged  : {unchanged}\n"
         f"  Errors     : {len(errors)}\n"
         f"  Avg chaos  : {avg_chaos:.3f}\n"
         f"  High-risk  : {high_risk}{err_report}"
@@ -638,17 +895,12 @@ def search_code(
     if not v.ping():
         return "❌ Valkey not reachable."
 
-    flags = 0 if case_sensitive else re.IGNORECASE
     keys = []
     rels = []
 
     # We use scan_iter, but we should yield batches instead of pulling all keys.
     # We will process in chunks and stop as soon as we hit max_results.
-    try:
-        pattern = re.compile(query, flags)
-    except re.error:
-        escaped = re.escape(query)
-        pattern = re.compile(escaped, flags)
+    pattern = _compile_query(query, case_sensitive)
 
     results: List[str] = []
     scanned = 0
@@ -665,19 +917,12 @@ def search_code(
         raw_docs = pipe.execute()
 
         for rel, raw in zip(b_rels, raw_docs):
-            if not raw:
+            # Binary placeholders are stored uncompressed; skip them before
+            # paying for a failed zstd decode and a utf-8 decode.
+            if not raw or raw.startswith(b"[BINARY"):
                 continue
 
-            try:
-                content_bytes = _decompress(raw)
-                content = content_bytes.decode("utf-8", errors="replace")
-            except Exception:
-                # Fallback for uncompressed or binary strings
-                content = (
-                    raw.decode("utf-8", errors="replace")
-                    if isinstance(raw, bytes)
-                    else str(raw)
-                )
+            content = _decode_doc(raw)
 
             if content.startswith("[BINARY"):
                 continue
@@ -687,19 +932,32 @@ def search_code(
             if not matches:
                 continue
 
-            lines = content.split("\n")
+            # Walk newline offsets incrementally instead of splitting the whole
+            # file; only the few context lines around each hit are sliced out.
             snippets = []
-            seen_lines = set()
+            pos = line_start = 0
+            shown = shown_off = 0  # lines before `shown` are already emitted
             for m in matches[:5]:
-                line_start = content[: m.start()].count("\n")
-                ctx_start = max(0, line_start - 2)
-                ctx_end = min(len(lines), line_start + 3)
-                for i in range(ctx_start, ctx_end):
-                    if i not in seen_lines:
-                        seen_lines.add(i)
-                        prefix = ">>>" if i == line_start else "   "
-                        display_line = lines[i].replace("❌", "✖")
-                        snippets.append(f"  {prefix} L{i+1}: {display_line}")
+                line_start += content.count("\n", pos, m.start())
+                pos = m.start()
+                ctx_start = max(line_start - 2, shown)
+                if ctx_start == shown:
+                    off = shown_off
+                else:
+                    off = content.rfind("\n", 0, pos) + 1
+                    for _ in range(line_start - ctx_start):
+                        off = content.rfind("\n", 0, off - 1) + 1
+                for i in range(ctx_start, line_start + 3):
+                    if off > len(content):
+                        break
+                    eol = content.find("\n", off)
+                    if eol < 0:
+                        eol = len(content)
+                    prefix = ">>>" if i == line_start else "   "
+                    display_line = content[off:eol].replace("❌", "✖")
+                    snippets.append(f"  {prefix} L{i+1}: {display_line}")
+                    off = eol + 1
+                    shown, shown_off = i + 1, off
 
             hit_text = "\n".join(snippets)
             results.append(
@@ -772,15 +1030,7 @@ def get_file(
             return f"❌ '{path}' not found. Did you mean:\n{suggestion}"
         return f"❌ '{path}' not found in the index."
 
-    try:
-        content_bytes = _decompress(raw)
-        content = content_bytes.decode("utf-8", errors="replace")
-    except Exception:
-        content = (
-            raw.decode("utf-8", errors="replace")
-            if isinstance(raw, bytes)
-            else str(raw)
-        )
+    content = _decode_doc(raw)
 
     lines = content.split("\n")
     numbered = "\n".join(f"{i+1:>5} | {line}" for i, line in enumerate(lines))
@@ -808,21 +1058,25 @@ def list_indexed_files(
     if not v.ping():
         return "❌ Valkey not reachable."
 
+    vglob = _to_valkey_glob(pattern)
     paths = []
-    members = v.r.zrangebyscore(FILE_LIST_KEY, "-inf", "+inf", start=0, num=100000)
-    if members:
-        for m in members:
-            if pattern == "*" or fnmatch(m, pattern):
-                paths.append(m)
-                if len(paths) >= max_results:
-                    break
+    if v.r.zcard(FILE_LIST_KEY):
+        # Filter server-side with ZSCAN MATCH; only fall back to fnmatch for
+        # patterns the Valkey glob matcher cannot express.
+        for m, _ in v.r.zscan_iter(FILE_LIST_KEY, match=vglob or "*", count=5000):
+            if vglob is None and not fnmatch(m, pattern):
+                continue
+            paths.append(m)
+            if len(paths) >= max_results:
+                break
     else:
-        for key in v.r.scan_iter(f"{FILE_HASH_PREFIX}*", count=500):
+        for key in v.r.scan_iter(f"{FILE_HASH_PREFIX}{vglob or '*'}", count=500):
             rel = key[len(FILE_HASH_PREFIX) :]
-            if pattern == "*" or fnmatch(rel, pattern):
-                paths.append(rel)
-                if len(paths) >= max_results:
-                    break
+            if vglob is None and not fnmatch(rel, pattern):
+                continue
+            paths.append(rel)
+            if len(paths) >= max_results:
+                break
 
     paths.sort()
     if not paths:
@@ -847,12 +1101,19 @@ def get_index_stats() -> str:
     doc_count = 0
     sig_count = 0
     chaos_count = 0
+    # Field probes are pipelined per 1000 keys instead of two round trips per file
+    pipe = v.r.pipeline(transaction=False)
     for key in v.r.scan_iter(f"{FILE_HASH_PREFIX}*", count=1000):
         doc_count += 1
-        if v.r.hexists(key, "sig"):
-            sig_count += 1
-        if v.r.hexists(key, "chaos"):
-            chaos_count += 1
+        pipe.hexists(key, "sig")
+        pipe.hexists(key, "chaos")
+        if doc_count % 1000 == 0:
+            flags = pipe.execute()
+            sig_count += sum(flags[0::2])
+            chaos_count += sum(flags[1::2])
+    flags = pipe.execute()
+    sig_count += sum(flags[0::2])
+    chaos_count += sum(flags[1::2])
 
     file_list_size = v.r.zcard(FILE_LIST_KEY) or 0
     db_size = v.r.dbsize()
@@ -860,7 +1121,7 @@ def get_index_stats() -> str:
     mem_human = info.get("used_memory_human", "?")
 
     meta_raw = v.r.get(META_KEY)
-    meta = json.loads(meta_raw) if meta_raw else {}
+    meta = orjson.loads(meta_raw) if meta_raw else {}
 
     return (
         f"📊 Codebase Index Stats\n"
@@ -961,33 +1222,15 @@ def verify_snippet(
     if index is None:
         return "❌ No manifold index available. Run ingest_repo first."
 
-    from src.manifold.sidecar import verify_snippet as _verify, ManifoldIndex
+    from src.manifold.sidecar import verify_snippet as _verify
 
+    path_filter = None
     if scope != "*":
-        # Filter by subsetting signatures whose occurrences reference matching docs
+        # Scope by filtering occurrences during matching, not by copying the index
         matching_docs = {p for p in index.documents if fnmatch(p, scope)}
         if not matching_docs:
             return f"❌ FAILED: No indexed files found matching scope '{scope}'."
-
-        filtered_sigs = {}
-        for sig, entry in index.signatures.items():
-            if not isinstance(entry, dict):
-                continue
-            occs = entry.get("occurrences", [])
-            filtered_occs = [
-                o
-                for o in occs
-                if isinstance(o, dict) and o.get("doc_id") in matching_docs
-            ]
-            if filtered_occs:
-                filtered_sigs[sig] = {**entry, "occurrences": filtered_occs}
-
-        filtered_docs = {p: d for p, d in index.documents.items() if p in matching_docs}
-        index = ManifoldIndex(
-            meta=index.meta,
-            signatures=filtered_sigs,
-            documents=filtered_docs,
-        )
+        path_filter = matching_docs.__contains__
 
     result = _verify(
         text=snippet,
@@ -997,6 +1240,7 @@ def verify_snippet(
         stride_bytes=384,
         precision=3,
         use_native=True,
+        path_filter=path_filter,
     )
 
     status = "✅ VERIFIED" if result.verified else "❌ FAILED"
@@ -1039,10 +1283,7 @@ def get_file_signature(
     if not raw:
         return f"❌ '{path}' not in index."
 
-    try:
-        content_bytes = _decompress(raw)
-    except Exception:
-        content_bytes = raw if isinstance(raw, bytes) else str(raw).encode("utf-8")
+    content_bytes = _unpack(raw)
 
     computed = _compute_sig(content_bytes)
     if computed:
@@ -1054,6 +1295,50 @@ def get_file_signature(
 # ===================================================================
 # TOOL: search_by_structure
 # ===================================================================
+# Server-side scan for search_by_structure: SCAN MATCH + HGET sig + distance
+# test all run inside Valkey, so only the in-tolerance (path, sig) pairs cross
+# the wire. Distances are recomputed in Python because Lua replies truncate
+# numbers to integers.
+_FIND_SIGS_LUA = """
+local pattern, plen = ARGV[1], string.len(ARGV[2])
+local tc, ts, te = tonumber(ARGV[3]), tonumber(ARGV[4]), tonumber(ARGV[5])
+local tol, limit = tonumber(ARGV[6]), tonumber(ARGV[7])
+local out = {}
+local cursor = "0"
+repeat
+  local page = redis.call("SCAN", cursor, "MATCH", pattern, "COUNT", 1000)
+  cursor = page[1]
+  for _, key in ipairs(page[2]) do
+    local sig = redis.call("HGET", key, "sig")
+    if sig then
+      local c, s, e = string.match(sig, "^c([%d.]+)_s([%d.]+)_e([%d.]+)")
+      c, s, e = tonumber(c), tonumber(s), tonumber(e)
+      if c and s and e then
+        local d = math.max(math.abs(tc - c), math.abs(ts - s), math.abs(te - e))
+        if d <= tol then
+          out[#out + 1] = string.sub(key, plen + 1)
+          out[#out + 1] = sig
+          if #out >= 2 * limit then
+            return out
+          end
+        end
+      end
+    end
+  end
+until cursor == "0"
+return out
+"""
+_find_sigs_script = None
+
+
+def _get_find_sigs_script(client):
+    """Register the structural-search Lua script once per Valkey client (EVALSHA)."""
+    global _find_sigs_script
+    if _find_sigs_script is None or _find_sigs_script.registered_client is not client:
+        _find_sigs_script = client.register_script(_FIND_SIGS_LUA)
+    return _find_sigs_script
+
+
 @mcp.tool()
 def search_by_structure(
     signature: Annotated[
@@ -1076,7 +1361,7 @@ def search_by_structure(
 
     Uses numeric proximity on the c/s/e components within *tolerance*.
     """
-    m = re.match(r"c([\d.]+)_s([\d.]+)_e([\d.]+)", signature)
+    m = _SIG_RE(signature)
     if not m:
         return f"❌ Invalid signature format. Expected 'cX.XXX_sX.XXX_eX.XXX'."
     tc, ts, te = float(m.group(1)), float(m.group(2)), float(m.group(3))
@@ -1085,27 +1370,51 @@ def search_by_structure(
     if not v.ping():
         return "❌ Valkey not reachable."
 
-    matches = []
-    for key in v.r.scan_iter(f"{FILE_HASH_PREFIX}*", count=500):
-        rel = key[len(FILE_HASH_PREFIX) :]
-        if scope != "*" and not fnmatch(rel, scope):
-            continue
+    def _scan_candidates():
+        for key in v.r.scan_iter(f"{FILE_HASH_PREFIX}*", count=500):
+            rel = key[len(FILE_HASH_PREFIX) :]
+            if scope != "*" and not fnmatch(rel, scope):
+                continue
+            sig_val = v.r.hget(key, "sig")
+            if sig_val:
+                yield rel, sig_val
+
+    limit = max_results * 3
+    candidates = None
+    vglob = _to_valkey_glob(scope)
+    if vglob is not None:
+        try:
+            flat = _get_find_sigs_script(v.r)(
+                args=[
+                    f"{FILE_HASH_PREFIX}{vglob}",
+                    FILE_HASH_PREFIX,
+                    tc,
+                    ts,
+                    te,
+                    tolerance,
+                    limit,
+                ]
+            )
+            candidates = zip(flat[0::2], flat[1::2])
+        except Exception:
+            pass  # scripting unavailable: fall back to the client-side scan
+    if candidates is None:
+        candidates = _scan_candidates()
 
-        sig_val = v.r.hget(key, "sig")
-        if not sig_val:
-            continue
-        sm = re.match(r"c([\d.]+)_s([\d.]+)_e([\d.]+)", sig_val)
+    parse_sig = _SIG_RE
+    matches = []
+    for rel, sig_val in candidates:
+        sm = parse_sig(sig_val)
         if not sm:
             continue
         sc, ss, se = float(sm.group(1)), float(sm.group(2)), float(sm.group(3))
         dist = max(abs(tc - sc), abs(ts - ss), abs(te - se))
         if dist <= tolerance:
             matches.append((dist, rel, sig_val))
-            if len(matches) >= max_results * 3:
+            if len(matches) >= limit:
                 break
 
-    matches.sort()
-    matches = matches[:max_results]
+    matches = heapq.nsmallest(max_results, matches)
 
     if not matches:
         return f"No files within tolerance {tolerance} of {signature}."
@@ -1330,7 +1639,7 @@ def start_watcher(
     automatically updating the Valkey index with new content and signatures.
     """
     global _active_observer
-    if _active_observer is not None:
+    if _active_observer is not None and _active_observer.is_alive():
         return "✅ Watcher already running."
 
     v = _get_valkey_wm()
@@ -1349,26 +1658,75 @@ def start_watcher(
 
     cap = max_bytes_per_file
 
-    import threading
-
     class DebouncedHandler(FileSystemEventHandler):
-        def __init__(self, debounce_secs=1.5):
+        """Coalesces bursts of events per path and flushes them in batches.
+
+        Events only record the newest intent (upsert or delete) for a path; a
+        single flusher thread picks up paths that have been quiet for
+        ``debounce_secs`` and writes the whole tick through one pipeline. The
+        flusher exits once *stop* is set (the observer's stopped_event).
+        """
+
+        def __init__(self, stop, debounce_secs=1.5, tick_secs=0.2):
             self.debounce_secs = debounce_secs
-            self._timers = {}
+            self.tick_secs = tick_secs
+            self._stop = stop
+            self._pending = {}  # src_path -> (deleted, deadline)
             self._lock = threading.Lock()
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="manifold-watch-flush", daemon=True
+            )
+            self._flusher.start()
 
-        def _schedule_ingest(self, src_path):
+        def _schedule(self, src_path, deleted=False):
             with self._lock:
-                if src_path in self._timers:
-                    self._timers[src_path].cancel()
+                self._pending[src_path] = (
+                    deleted,
+                    time.monotonic() + self.debounce_secs,
+                )
 
-                timer = threading.Timer(
-                    self.debounce_secs, self._ingest, args=[src_path]
+        def _flush_loop(self):
+            while not self._stop.wait(self.tick_secs):
+                now = time.monotonic()
+                with self._lock:
+                    ready = [p for p, (_, due) in self._pending.items() if due <= now]
+                    batch = {p: self._pending.pop(p)[0] for p in ready}
+                if batch:
+                    self._flush(batch)
+
+        def _flush(self, batch):
+            vk = _get_valkey_wm()
+            pipe = vk.raw_r.pipeline(transaction=False)
+            for src_path, deleted in batch.items():
+                try:
+                    if deleted:
+                        self._queue_delete(pipe, src_path)
+                    else:
+                        self._queue_ingest(pipe, src_path)
+                except Exception as exc:
+                    action = "delete" if deleted else "ingest"
+                    print(
+                        f"❌ Watcher failed to {action} {src_path}: {exc}",
+                        file=sys.stderr,
+                    )
+            try:
+                pipe.execute()
+            except Exception as exc:
+                print(
+                    f"❌ Watcher failed to write {len(batch)} path(s) to Valkey: {exc}",
+                    file=sys.stderr,
                 )
-                self._timers[src_path] = timer
-                timer.start()
 
-        def _ingest(self, src_path):
+        def _queue_delete(self, pipe, src_path):
+            try:
+                rel = os.path.relpath(Path(src_path), WORKSPACE_ROOT)
+            except ValueError:
+                return
+            pipe.delete(f"{FILE_HASH_PREFIX}{rel}".encode("utf-8"))
+            pipe.zrem(FILE_LIST_KEY, rel)
+            pipe.zrem(CHAOS_ZSET_KEY, rel)
+
+        def _queue_ingest(self, pipe, src_path):
             path = Path(src_path)
             if not path.is_file() or _should_skip(path):
                 return
@@ -1376,91 +1734,51 @@ def start_watcher(
                 rel = os.path.relpath(path, WORKSPACE_ROOT)
             except ValueError:
                 return
-            try:
-                raw = _read_capped(path, cap)
-                if not raw:
-                    return
-
-                vk = _get_valkey_wm()
-                vk.raw_r.hset(
-                    f"{FILE_HASH_PREFIX}{rel}".encode("utf-8"),
-                    mapping={b"doc": _compress(raw)},
-                )
+            raw = _read_capped(path, cap)
+            if not raw:
+                return
 
-                vk.r.zadd(FILE_LIST_KEY, {rel: len(raw)})
-
-                # Semantic Indexing update via AST on save
-                if path.suffix == ".py" and _is_text(path) and len(raw) < 1_000_000:
-                    try:
-                        from src.manifold.semantic import extract_semantic_nodes
-
-                        content_str = raw.decode("utf-8", errors="replace")
-                        nodes = extract_semantic_nodes(rel, content_str)
-                        if nodes:
-                            sem_idx = _get_semantic_index()
-                            if sem_idx:
-                                # Quick append handling to re-embed modified file
-                                remaining_nodes = [
-                                    n
-                                    for k, n in sem_idx.metadata.items()
-                                    if n.get("file_path") != rel
-                                ]
-                                # Rebuild semantic index with original plus new modified nodes
-                                # For a massive codebase, this needs delta-indexing. But for prototype, full rebuild.
-                                # Not optimal but functional for O(1) prototype.
-                                # We skip rebuilding active faiss on save to save CPU, just compute if needed
-                                pass
-                    except Exception:
-                        pass
-
-                # Also compute chaos profile on save
-                if len(raw) >= 512:
-                    sig = _compute_sig(raw)
-                    if sig:
-                        vk.raw_r.hset(
-                            f"{FILE_HASH_PREFIX}{rel}".encode("utf-8"),
-                            b"sig",
-                            sig,
-                        )
+            fields = {b"doc": _compress(raw)}
+
+            # Also compute chaos profile on save
+            if len(raw) >= 512:
+                sig = _compute_sig(raw)
+                if sig:
+                    fields[b"sig"] = sig
 
-                    chaos = _compute_chaos_result(raw)
-                    if chaos:
-                        chaos_json = json.dumps(chaos).encode("utf-8")
-                        vk.raw_r.hset(
-                            f"{FILE_HASH_PREFIX}{rel}".encode("utf-8"),
-                            b"chaos",
-                            _compress(chaos_json),
+                chaos = _compute_chaos_result(raw)
+                if chaos:
+                    fields[b"chaos"] = _encode_chaos(chaos)
+                    pipe.zadd(CHAOS_ZSET_KEY, {rel: chaos["chaos_score"]})
+
+                    # Proactive ejection alert
+                    if chaos["chaos_score"] > 0.40:
+                        print(
+                            f"⚠️ [EJECTION ALERT] Highly unstable save detected on {rel}! Chaos: {chaos['chaos_score']:.3f}"
                         )
 
-                        # Proactive ejection alert
-                        if chaos["chaos_score"] > 0.40:
-                            print(
-                                f"⚠️ [EJECTION ALERT] Highly unstable save detected on {rel}! Chaos: {chaos['chaos_score']:.3f}"
-                            )
-            except Exception:
-                pass
+            hash_key = f"{FILE_HASH_PREFIX}{rel}".encode("utf-8")
+            if b"chaos" not in fields:
+                # The previous save's profile no longer describes this content
+                pipe.hdel(hash_key, b"chaos")
+                pipe.zrem(CHAOS_ZSET_KEY, rel)
+            pipe.hset(hash_key, mapping=fields)
+            pipe.zadd(FILE_LIST_KEY, {rel: len(raw)})
 
         def on_modified(self, event):
             if not event.is_directory:
-                self._schedule_ingest(event.src_path)
+                self._schedule(event.src_path)
 
         def on_created(self, event):
             if not event.is_directory:
-                self._schedule_ingest(event.src_path)
+                self._schedule(event.src_path)
 
         def on_deleted(self, event):
             if not event.is_directory:
-                path = Path(event.src_path)
-                try:
-                    rel = os.path.relpath(path, v.r_root)
-                except ValueError:
-                    return
-                vk = _get_valkey_wm()
-                vk.raw_r.delete(f"{FILE_HASH_PREFIX}{rel}".encode("utf-8"))
-                vk.r.zrem(FILE_LIST_KEY, rel)
-
-    handler = DebouncedHandler()
+                self._schedule(event.src_path, deleted=True)
+
     _active_observer = observer = Observer()
+    handler = DebouncedHandler(observer.stopped_event)
     observer.schedule(handler, str(target), recursive=True)
     observer.daemon = True
     observer.start()
@@ -1520,10 +1838,17 @@ def remove_fact(
     rel = (
         os.path.relpath(fact_id, WORKSPACE_ROOT) if os.path.isabs(fact_id) else fact_id
     )
-    v.remove_document(rel)
-    v.raw_r.delete(f"{FILE_HASH_PREFIX}{rel}".encode("utf-8"))
-    v.r.zrem(FILE_LIST_KEY, rel)
-    v.invalidate_index()
+    # Document, file hash and both index caches go in one DEL, one round trip
+    pipe = v.r.pipeline(transaction=False)
+    pipe.delete(
+        f"{v.doc_prefix}{rel}",
+        f"{FILE_HASH_PREFIX}{rel}",
+        v.index_key,
+        v.semantic_index_key,
+    )
+    pipe.zrem(FILE_LIST_KEY, rel)
+    pipe.zrem(CHAOS_ZSET_KEY, rel)
+    pipe.execute()
     return f"🗑️ Fact '{fact_id}' removed from the Dynamic Semantic Codebook."
 
 
@@ -1532,38 +1857,26 @@ def remove_fact(
 # ===================================================================
 def _get_dynamic_thresholds():
     """Dynamically compute structural thresholds from current index percentiles."""
-    v = _get_valkey_wm()
     import numpy as np
 
+    from src.manifold.sidecar import parse_signature
+
     hazards = []
     coherences = []
     entropies = []
 
-    for key_bytes in v.raw_r.scan_iter(
-        f"{FILE_HASH_PREFIX}*".encode("utf-8"), count=500
-    ):
+    for _, (raw_chaos, raw_sig) in _scan_file_fields("*", (b"chaos", b"sig")):
         try:
-            raw_chaos = v.raw_r.hget(key_bytes, b"chaos")
             if raw_chaos:
-                try:
-                    js_bytes = _decompress(raw_chaos)
-                    js_str = js_bytes.decode("utf-8", errors="replace")
-                except Exception:
-                    js_str = (
-                        raw_chaos.decode("utf-8", errors="replace")
-                        if isinstance(raw_chaos, bytes)
-                        else str(raw_chaos)
-                    )
-                chaos = float(json.loads(js_str).get("chaos_score", 0.0))
+                chaos = float(_decode_chaos(raw_chaos).get("chaos_score", 0.0))
                 if chaos > 0.0:
                     hazards.append(chaos)
 
-            raw_sig = v.raw_r.hget(key_bytes, b"sig")
             if raw_sig:
-                parts = raw_sig.decode("utf-8", errors="replace").split("_")
-                if len(parts) == 3:
-                    coherences.append(float(parts[0][1:]))
-                    entropies.append(float(parts[2][1:]))
+                parsed = parse_signature(raw_sig.decode("utf-8", errors="replace"))
+                if parsed is not None:
+                    coherences.append(parsed[0])
+                    entropies.append(parsed[2])
         except Exception:
             pass
 
@@ -1603,23 +1916,12 @@ def analyze_code_chaos(
     """
     current_root = _get_index_root()
     path = os.path.relpath(path, current_root) if os.path.isabs(path) else path
-    v = _get_valkey_wm()
-    raw = v.raw_r.hget(f"{FILE_HASH_PREFIX}{path}", "doc")
+    raw = _get_valkey_wm().raw_r.hget(f"{FILE_HASH_PREFIX}{path}", "doc")
     if not raw:
         return "❌ File not indexed."
 
-    try:
-        content_bytes = _decompress(raw)
-        content_final_str = content_bytes.decode("utf-8", errors="replace")
-    except Exception:
-        content_final_str = (
-            raw.decode("utf-8", errors="replace")
-            if isinstance(raw, bytes)
-            else str(raw)
-        )
-
-    raw_bytes = content_final_str.encode("utf-8", errors="replace")
-    result = _compute_chaos_result(raw_bytes)
+    # Only the head feeds the chaos profile; don't inflate the whole document
+    result = _compute_chaos_result(_unpack_head(raw, _CHAOS_HEAD_BYTES))
     if not result:
         return "❌ Could not compute chaos (file too short or kernel unavailable)."
 
@@ -1632,6 +1934,76 @@ Windows analyzed                      : {result['windows_analyzed']}
 """
 
 
+@mcp.tool()
+def batch_analyze_code_chaos(
+    paths: Annotated[
+        List[str],
+        Field(
+            description="File paths relative to repo root (e.g. ['mcp_server.py', 'src/manifold/sidecar.py'])"
+        ),
+    ],
+) -> str:
+    """Run analyze_code_chaos over several files with one pipelined Valkey fetch.
+
+    Returns one line per file (risk, chaos score, entropy, coherence) in the
+    order the paths were given.
+    """
+    if not paths:
+        return "❌ No paths given."
+
+    current_root = _get_index_root()
+    rels = [os.path.relpath(p, current_root) if os.path.isabs(p) else p for p in paths]
+    v = _get_valkey_wm()
+    if not v.ping():
+        return "❌ Valkey not reachable."
+
+    rows = _hmget_batch([f"{FILE_HASH_PREFIX}{rel}" for rel in rels], (b"doc",))
+
+    lines = [f"📈 Batch Chaos Analysis ({len(rels)} files):\n"]
+    for rel, (raw,) in zip(rels, rows):
+        if not raw:
+            lines.append(f"  ❌ not indexed | {rel}")
+            continue
+        result = _compute_chaos_result(_unpack_head(raw, _CHAOS_HEAD_BYTES))
+        if not result:
+            lines.append(f"  ❌ too short or kernel unavailable | {rel}")
+            continue
+        lines.append(
+            f"  [{result['collapse_risk']}] {result['chaos_score']:.3f} | "
+            f"entropy {result['entropy']:.3f} | coherence {result['coherence']:.3f} | {rel}"
+        )
+    return "\n".join(lines)
+
+
+def _top_chaos_ranked(v, max_files: int, *patterns: str):
+    """Walk CHAOS_ZSET_KEY from the top until *max_files* paths match *patterns*.
+
+    Returns ``(score, rel, chaos)`` tuples in the same order as a full scan
+    ranked with heapq.nlargest (equal scores fall back to descending path).
+    """
+    filters = [p for p in patterns if p != "*"]
+    results = []
+    start, page_size = 0, max(max_files, 500)
+    while len(results) < max_files:
+        page = v.r.zrevrange(
+            CHAOS_ZSET_KEY, start, start + page_size - 1, withscores=True
+        )
+        if not page:
+            break
+        start += page_size
+        matched = [
+            (score, rel) for rel, score in page if all(fnmatch(rel, p) for p in filters)
+        ]
+        keys = [f"{FILE_HASH_PREFIX}{rel}".encode("utf-8") for _, rel in matched]
+        for (score, rel), (raw,) in zip(matched, _hmget_batch(keys, (b"chaos",))):
+            # A member whose hash lost its profile is stale; skip it
+            if raw:
+                results.append((score, rel, _decode_chaos(raw)))
+                if len(results) >= max_files:
+                    break
+    return results
+
+
 @mcp.tool()
 def batch_chaos_scan(
     pattern: Annotated[
@@ -1653,47 +2025,20 @@ def batch_chaos_scan(
     if not v.ping():
         return "❌ Valkey not reachable."
 
-    results = []
-    keys = []
-    rels = []
-    for key in v.r.scan_iter(f"{FILE_HASH_PREFIX}*", count=500):
-        rel = key[len(FILE_HASH_PREFIX) :]
-        if pattern != "*" and not fnmatch(rel, pattern):
-            continue
-        if scope != "*" and not fnmatch(rel, scope):
-            continue
-        keys.append(key)
-        rels.append(rel)
-
-    batch_size = 500
-    for i in range(0, len(keys), batch_size):
-        batch_keys = keys[i : i + batch_size]
-        batch_rels = rels[i : i + batch_size]
-
-        pipe = v.raw_r.pipeline(transaction=False)
-        for key in batch_keys:
-            pipe.hget(key.encode("utf-8"), b"chaos")
-        chaos_docs = pipe.execute()
-
-        for rel, chaos_data in zip(batch_rels, chaos_docs):
+    if _chaos_ranked(v):
+        results = _top_chaos_ranked(v, max_files, pattern, scope)
+    else:
+        results = []
+        match, keep = _glob_pushdown(pattern, scope)
+        for rel, (chaos_data,) in _scan_file_fields(match, (b"chaos",), keep):
             if chaos_data:
                 try:
-                    try:
-                        js_bytes = _decompress(chaos_data)
-                        js = js_bytes.decode("utf-8", errors="replace")
-                    except Exception:
-                        js = (
-                            chaos_data.decode("utf-8", errors="replace")
-                            if isinstance(chaos_data, bytes)
-                            else str(chaos_data)
-                        )
-                    chaos = json.loads(js)
+                    chaos = _decode_chaos(chaos_data)
                     results.append((chaos["chaos_score"], rel, chaos))
                 except json.JSONDecodeError:
                     pass
 
-    results.sort(reverse=True)
-    results = results[:max_files]
+        results = heapq.nlargest(max_files, results)
 
     if not results:
         return f"No chaos profiles found matching '{pattern}'."
@@ -1726,24 +2071,12 @@ def predict_structural_ejection(
     """
     current_root = _get_index_root()
     path = os.path.relpath(path, current_root) if os.path.isabs(path) else path
-    v = _get_valkey_wm()
-    chaos_data = v.raw_r.hget(f"{FILE_HASH_PREFIX}{path}", "chaos")
-    if not chaos_data:
-        return f"❌ No chaos profile for {path}. Run analyze_code_chaos first."
-
     try:
-        try:
-            js_bytes = _decompress(chaos_data)
-            js = js_bytes.decode("utf-8", errors="replace")
-        except Exception:
-            js = (
-                chaos_data.decode("utf-8", errors="replace")
-                if isinstance(chaos_data, bytes)
-                else str(chaos_data)
-            )
-        chaos = json.loads(js)
+        chaos = _fetch_chaos(path)
     except Exception:
         return f"❌ Failed to parse chaos profile for {path}."
+    if chaos is None:
+        return f"❌ No chaos profile for {path}. Run analyze_code_chaos first."
 
     score = chaos["chaos_score"]
 
@@ -1760,99 +2093,48 @@ def predict_structural_ejection(
         return f"✅ {path} is in LOW_FLUCTUATION state (score: {score:.3f}).\nStructurally stable."
 
 
-@mcp.tool()
-def visualize_manifold_trajectory(
-    path: Annotated[
-        str, Field(description="File path relative to repo root to visualize")
-    ],
-) -> str:
-    """Generates the exact 4-panel dashboard (physical reality colored by chaos score + scatter vs LLE analog + time series).
-
-    Renders:
-      Panel 1 (top-left):  Structural trajectory – byte offset vs coherence, colored by hazard (chaos score).
-      Panel 2 (top-right): Chaos vs LLE analog – scatter of entropy vs hazard per window.
-      Panel 3 (bottom-left): Time series – hazard, entropy, coherence over window index.
-      Panel 4 (bottom-right): Symbolic state distribution – LOW / OSCILLATION / PERSISTENT_HIGH bar chart.
+# Plotly traces hold back-references to their figure, so each dashboard is a
+# reference cycle; collect them periodically in long-running servers.
+_VIZ_GC_EVERY = 32
+_viz_calls = 0
 
-    Saves a PNG to reports/ and returns the metrics summary + file path.
-    """
-    current_root = _get_index_root()
-    path = os.path.relpath(path, current_root) if os.path.isabs(path) else path
 
-    v = _get_valkey_wm()
-    if not v.ping():
-        return "❌ Valkey not reachable."
+def _release_figure(fig) -> None:
+    """Drop a rendered figure's traces and collect cycles every few renders."""
+    global _viz_calls
+    fig.data = []
+    _viz_calls += 1
+    if _viz_calls % _VIZ_GC_EVERY == 0:
+        gc.collect()
 
-    try:
-        import plotly.graph_objects as go
-        from plotly.subplots import make_subplots
-        import numpy as np
-    except ImportError:
-        return "❌ Plotly is required for interactive visualizations (run: pip install plotly)."
 
-    content_raw = v.raw_r.hget(f"{FILE_HASH_PREFIX}{path}", "doc")
-    if not content_raw:
-        return f"❌ File '{path}' not indexed. Run ingest_repo first."
+# Dashboards render off the request thread; the tool waits briefly so small
+# files still report write errors synchronously.
+_RENDER_WAIT_S = 0.5
+_render_pool = None
 
-    try:
-        content_bytes = _decompress(content_raw)
-        content_final_str = content_bytes.decode("utf-8", errors="replace")
-    except Exception:
-        content_final_str = (
-            content_raw.decode("utf-8", errors="replace")
-            if isinstance(content_raw, bytes)
-            else str(content_raw)
-        )
+# Latest render per output path. A render that outlives the wait is collected
+# by the next call for the same dashboard, which reports it if it failed.
+_pending_renders: Dict[Path, concurrent.futures.Future] = {}
 
-    # Encode the full file to get per-window metrics
-    try:
-        from src.manifold.sidecar import encode_text
 
-        encoded = encode_text(
-            content_final_str[:8192],  # cap at 8 KB for visualization
-            window_bytes=512,
-            stride_bytes=384,
-            precision=3,
-            use_native=True,
+def _get_render_pool():
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="manifold-render"
         )
-    except Exception as exc:
-        return f"❌ Could not encode '{path}' for visualization: {exc}"
+    return _render_pool
 
-    if not encoded.windows:
-        return f"❌ No windows produced for '{path}' (file may be too short)."
 
-    # Extract per-window metrics
-    n = len(encoded.windows)
-    hazards = np.array([w.hazard for w in encoded.windows])
-    entropies = np.array([w.entropy for w in encoded.windows])
-    coherences = np.array([w.coherence for w in encoded.windows])
-    byte_starts = np.array([w.byte_start for w in encoded.windows])
+def _render_dashboard(
+    out_path: Path, title: str, byte_starts, hazards, entropies, coherences
+) -> None:
+    """Build the 4-panel Plotly dashboard and atomically write it to *out_path*."""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
 
-    # Classify symbolic states
-    thresholds = _get_dynamic_thresholds()
-    chaos_high = thresholds["chaos_high"]
-    chaos_low = thresholds["chaos_low"]
-
-    states = []
-    for h in hazards:
-        if h >= chaos_high:
-            states.append("PERSISTENT_HIGH")
-        elif h >= chaos_low:
-            states.append("OSCILLATION")
-        else:
-            states.append("LOW_FLUCTUATION")
-
-    state_counts = {
-        "LOW_FLUCTUATION": states.count("LOW_FLUCTUATION"),
-        "OSCILLATION": states.count("OSCILLATION"),
-        "PERSISTENT_HIGH": states.count("PERSISTENT_HIGH"),
-    }
-
-    # Compute aggregate stats
-    avg_hazard = float(np.mean(hazards))
-    avg_entropy = float(np.mean(entropies))
-    avg_coherence = float(np.mean(coherences))
-    max_hazard = float(np.max(hazards))
+    avg_coherence = float(coherences.mean())
 
     # --- Build 4-panel interactive Plotly figure ---
     fig = make_subplots(
@@ -1867,9 +2149,11 @@ def visualize_manifold_trajectory(
         specs=[[{"type": "xy"}, {"type": "xy"}], [{"type": "scene"}, {"type": "xy"}]],
     )
 
+    # 2D scatters use WebGL (Scattergl) without marker outlines so that
+    # whole-file trajectories with thousands of windows stay responsive.
     # Panel 1 (top-left): Structural trajectory
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=byte_starts,
             y=coherences,
             mode="markers",
@@ -1880,7 +2164,6 @@ def visualize_manifold_trajectory(
                 reversescale=True,
                 showscale=True,
                 colorbar=dict(title="Hazard", x=-0.1, thickness=15),
-                line=dict(width=0.5, color="black"),
             ),
             text=[
                 f"Byte: {b}<br>Coh: {c:.3f}<br>Haz: {h:.3f}"
@@ -1914,7 +2197,7 @@ def visualize_manifold_trajectory(
         col=2,
     )
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=entropies,
             y=hazards,
             mode="markers",
@@ -1954,7 +2237,7 @@ def visualize_manifold_trajectory(
     # Plotly doesn't have a direct hexbin-with-C equivalent natively built-in easily without dropping to 2D scatter with colors.
     # We will use a scatter plot colored by Hazard over Coherence/Entropy space.
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=coherences,
             y=entropies,
             mode="markers",
@@ -1977,7 +2260,7 @@ def visualize_manifold_trajectory(
     )
 
     fig.update_layout(
-        title=f"Structural Manifold Phase Space — {path}<br><sup>Windows={n}, Avg Chaos={avg_hazard:.3f}, Avg Entropy={avg_entropy:.3f}, Avg Coherence={avg_coherence:.3f}</sup>",
+        title=title,
         height=900,
         width=1200,
         showlegend=False,
@@ -1988,18 +2271,140 @@ def visualize_manifold_trajectory(
         ),
     )
 
+    # Write beside the target and swap in, so readers never see a partial file
+    tmp_path = out_path.with_name(f".{out_path.name}.{threading.get_ident()}.tmp")
+    try:
+        fig.write_html(str(tmp_path))
+        os.replace(tmp_path, out_path)
+    finally:
+        _release_figure(fig)
+        del fig
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _log_render_failure(future) -> None:
+    exc = future.exception()
+    if exc is not None:
+        print(f"❌ Dashboard render failed: {exc}", file=sys.stderr)
+
+
+@mcp.tool()
+def visualize_manifold_trajectory(
+    path: Annotated[
+        str, Field(description="File path relative to repo root to visualize")
+    ],
+) -> str:
+    """Generates the exact 4-panel dashboard (physical reality colored by chaos score + scatter vs LLE analog + time series).
+
+    Renders:
+      Panel 1 (top-left):  Structural trajectory – byte offset vs coherence, colored by hazard (chaos score).
+      Panel 2 (top-right): Chaos vs LLE analog – scatter of entropy vs hazard per window.
+      Panel 3 (bottom-left): Time series – hazard, entropy, coherence over window index.
+      Panel 4 (bottom-right): Symbolic state distribution – LOW / OSCILLATION / PERSISTENT_HIGH bar chart.
+
+    Saves an HTML dashboard to reports/ and returns the metrics summary + file
+    path. Large dashboards may still be rendering when the summary returns; the
+    next call for the same file reports it if that render failed.
+    """
+    current_root = _get_index_root()
+    path = os.path.relpath(path, current_root) if os.path.isabs(path) else path
+
+    v = _get_valkey_wm()
+    if not v.ping():
+        return "❌ Valkey not reachable."
+
+    try:
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        import numpy as np
+    except ImportError:
+        return "❌ Plotly is required for interactive visualizations (run: pip install plotly)."
+
+    content_final_str = _fetch_doc(path)
+    if content_final_str is None:
+        return f"❌ File '{path}' not indexed. Run ingest_repo first."
+
+    # Encode the full file straight into per-window metric columns
+    try:
+        from src.manifold.sidecar import encode_text_arrays
+
+        columns = encode_text_arrays(
+            content_final_str,
+            window_bytes=512,
+            stride_bytes=384,
+            precision=3,
+        )
+    except Exception as exc:
+        return f"❌ Could not encode '{path}' for visualization: {exc}"
+
+    hazards = columns["hazard"]
+    entropies = columns["entropy"]
+    coherences = columns["coherence"]
+    byte_starts = columns["byte_start"]
+    n = len(hazards)
+    if not n:
+        return f"❌ No windows produced for '{path}' (file may be too short)."
+
+    # Classify symbolic states
+    thresholds = _get_dynamic_thresholds()
+    chaos_high = thresholds["chaos_high"]
+    chaos_low = thresholds["chaos_low"]
+
+    # State code indexes _STATE_LABELS; chaos_low <= chaos_high, so the two
+    # masks sum to it
+    codes = (hazards >= chaos_low).astype(np.int8)
+    codes += hazards >= chaos_high
+    state_counts = dict(
+        zip(_STATE_LABELS, np.bincount(codes, minlength=3)[:3].tolist())
+    )
+
+    # Compute aggregate stats
+    avg_hazard = float(np.mean(hazards))
+    avg_entropy = float(np.mean(entropies))
+    avg_coherence = float(np.mean(coherences))
+    max_hazard = float(np.max(hazards))
+
     # Save to reports/
     current_root = _get_index_root()
     report_dir = current_root / "reports"
     report_dir.mkdir(exist_ok=True)
-    safe_name = re.sub(r"[^\w.]", "_", path)
+    safe_name = _SAFE_NAME_RE.sub("_", path)
 
-    # Save as HTML to make it interactive as requested
+    # Save as HTML to make it interactive as requested. Rendering runs on the
+    # render pool; small dashboards finish within the wait, large ones keep
+    # rendering after the summary is returned.
     out_path = report_dir / f"manifold_trajectory_{safe_name}.html"
+    title = (
+        f"Structural Manifold Phase Space — {path}<br><sup>Windows={n}, "
+        f"Avg Chaos={avg_hazard:.3f}, Avg Entropy={avg_entropy:.3f}, "
+        f"Avg Coherence={avg_coherence:.3f}</sup>"
+    )
+    rel_out = out_path.relative_to(current_root)
+    # A render still running is superseded by this one (the newest write wins)
+    prior = _pending_renders.pop(out_path, None)
+    prior_note = ""
+    if prior is not None and prior.done() and prior.exception() is not None:
+        prior_note = f"⚠️ Previous render of {rel_out} failed: {prior.exception()}\n"
+
+    future = _get_render_pool().submit(
+        _render_dashboard,
+        out_path,
+        title,
+        byte_starts,
+        hazards,
+        entropies,
+        coherences,
+    )
+    future.add_done_callback(_log_render_failure)
     try:
-        fig.write_html(str(out_path))
+        future.result(timeout=_RENDER_WAIT_S)
+        saved = f"saved to: {rel_out}"
+    except concurrent.futures.TimeoutError:
+        _pending_renders[out_path] = future
+        saved = f"rendering to: {rel_out}, not yet written"
     except Exception as e:
-        return f"❌ Failed to write HTML output: {e}"
+        return f"{prior_note}❌ Failed to write HTML output: {e}"
 
     # Build text summary
     collapse_risk = (
@@ -2009,7 +2414,7 @@ def visualize_manifold_trajectory(
     )
 
     return (
-        f"📊 4-Panel Manifold Dashboard saved to: {out_path.relative_to(current_root)}\n\n"
+        f"{prior_note}📊 4-Panel Manifold Dashboard {saved}\n\n"
         f"  File                : {path}\n"
         f"  Windows analyzed    : {n}\n"
         f"  Avg Chaos Score     : {avg_hazard:.3f}\n"
@@ -2057,6 +2462,8 @@ def cluster_codebase_structure(
 
     import numpy as np
 
+    from src.manifold.sidecar import parse_signature
+
     try:
         import faiss
     except ImportError:
@@ -2080,27 +2487,15 @@ def cluster_codebase_structure(
             if not raw_sig:
                 continue
 
-            sig_str = raw_sig.decode("utf-8", errors="replace")
-            # Parse 'cX.XXX_sX.XXX_eX.XXX'
-            parts = sig_str.split("_")
-            c = float(parts[0][1:])
-            s = float(parts[1][1:])
-            e = float(parts[2][1:])
+            parsed = parse_signature(raw_sig.decode("utf-8", errors="replace"))
+            if parsed is None:
+                continue
+            c, s, e = parsed
 
             chaos = 0.0
             if raw_chaos:
                 try:
-                    js_bytes = _decompress(raw_chaos)
-                    js = js_bytes.decode("utf-8", errors="replace")
-                except Exception:
-                    js = (
-                        raw_chaos.decode("utf-8", errors="replace")
-                        if isinstance(raw_chaos, bytes)
-                        else str(raw_chaos)
-                    )
-                try:
-                    chaos_data = json.loads(js)
-                    chaos = float(chaos_data.get("chaos_score", 0.0))
+                    chaos = float(_decode_chaos(raw_chaos).get("chaos_score", 0.0))
                 except json.JSONDecodeError:
                     pass
 
@@ -2206,7 +2601,9 @@ def analyze_blast_radius(
     """Analyze the blast radius of a file.
 
     Shows how many files would be impacted if this file were changed.
-    Uses AST analysis to trace import dependencies.
+    Uses AST analysis to trace import dependencies. Dependency depth is the
+    longest chain of importers above the file; an import cycle counts as a
+    single level, and every file in it reports the same depth.
     """
     current_root = _get_index_root()
     path = os.path.relpath(path, current_root) if os.path.isabs(path) else path
@@ -2272,8 +2669,7 @@ def compute_combined_risk(
         return f"❌ No chaos data for '{path}'. Run ingest_repo first."
 
     try:
-        chaos_json = _decompress(raw_chaos).decode("utf-8")
-        chaos_data = json.loads(chaos_json)
+        chaos_data = _decode_chaos(raw_chaos)
         chaos_score = chaos_data["chaos_score"]
     except Exception:
         return f"❌ Could not parse chaos data for '{path}'."
@@ -2358,9 +2754,7 @@ def scan_critical_files(
         for rel, chaos_bytes in zip(batch_rels, chaos_docs):
             if chaos_bytes:
                 try:
-                    js = _decompress(chaos_bytes).decode("utf-8")
-                    chaos = json.loads(js)
-                    chaos_data[rel] = chaos["chaos_score"]
+                    chaos_data[rel] = _decode_chaos(chaos_bytes)["chaos_score"]
                 except Exception:
                     pass
 
@@ -2371,8 +2765,10 @@ def scan_critical_files(
         return f"❌ Error analyzing dependencies: {str(e)}"
 
     # Sort by chaos first (chaos is ~60% of score)
-    sorted_chaos = sorted(chaos_data.items(), key=lambda x: x[1], reverse=True)
-    candidate_list = sorted_chaos[: max_files * 5]  # Top candidates based on chaos
+    # Top candidates based on chaos
+    candidate_list = heapq.nlargest(
+        max_files * 5, chaos_data.items(), key=lambda x: x[1]
+    )
 
     # Compute combined risks
     critical_files = []
@@ -2385,8 +2781,7 @@ def scan_critical_files(
         critical_files.append((file_path, combined, risk_level, chaos, blast_radius))
 
     # Sort by combined risk descending
-    critical_files.sort(key=lambda x: x[1], reverse=True)
-    critical_files = critical_files[:max_files]
+    critical_files = heapq.nlargest(max_files, critical_files, key=lambda x: x[1])
 
     if not critical_files:
         return "No critical files found."
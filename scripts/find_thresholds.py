@@ -1,4 +1,3 @@
-import json
 import numpy as np
 import os
 import sys
@@ -7,6 +6,8 @@ import sys
 sys.path.insert(0, "/sep/structural-manifold-compression/SEP-mcp")
 
 from src.manifold.valkey_client import ValkeyWorkingMemory
+from src.manifold.chaos_codec import decode_chaos
+from src.manifold.sidecar import parse_signature
 import faiss
 
 
@@ -16,40 +17,45 @@ def get_thresholds():
         print("Valkey not reachable.")
         return
 
-    def _decompress(data: bytes) -> bytes:
-        import zstandard
-
-        dctx = zstandard.ZstdDecompressor()
-        return dctx.decompress(data)
-
     hazards = []
     coherences = []
     entropies = []
 
     FILE_HASH_PREFIX = "manifold:file:"
 
-    for key_bytes in v.raw_r.scan_iter(
-        f"{FILE_HASH_PREFIX}*".encode("utf-8"), count=500
-    ):
+    def _hmget(keys):
+        pipe = v.raw_r.pipeline(transaction=False)
+        for key in keys:
+            pipe.hmget(key, b"chaos", b"sig")
+        return pipe.execute()
+
+    def _iter_fields(batch_size=1000):
+        # One pipelined HMGET burst per batch instead of two HGET round trips per key
+        keys = []
+        for key_bytes in v.raw_r.scan_iter(
+            f"{FILE_HASH_PREFIX}*".encode("utf-8"), count=5000
+        ):
+            keys.append(key_bytes)
+            if len(keys) >= batch_size:
+                yield from _hmget(keys)
+                keys = []
+        if keys:
+            yield from _hmget(keys)
+
+    for raw_chaos, raw_sig in _iter_fields():
         try:
             # Get Chaos
-            raw_chaos = v.raw_r.hget(key_bytes, b"chaos")
             if raw_chaos:
-                js_bytes = _decompress(raw_chaos)
-                js = js_bytes.decode("utf-8", errors="replace")
-                chaos_data = json.loads(js)
+                chaos_data = decode_chaos(raw_chaos)
                 chaos = float(chaos_data.get("chaos_score", 0.0))
                 if chaos > 0.0:
                     hazards.append(chaos)
 
             # Get C, S, E from Sig
-            raw_sig = v.raw_r.hget(key_bytes, b"sig")
             if raw_sig:
-                sig_str = raw_sig.decode("utf-8", errors="replace")
-                parts = sig_str.split("_")
-                if len(parts) == 3:
-                    c = float(parts[0][1:])
-                    e = float(parts[2][1:])
+                parsed = parse_signature(raw_sig.decode("utf-8", errors="replace"))
+                if parsed is not None:
+                    c, _, e = parsed
                     coherences.append(c)
                     entropies.append(e)
 
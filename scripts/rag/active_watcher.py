@@ -8,8 +8,10 @@ manifold signatures, and streams the updates to the active Valkey memory.
 import sys
 import time
 import argparse
+import threading
 
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from src.manifold.valkey_client import ValkeyWorkingMemory
@@ -47,51 +49,115 @@ def should_process(file_path: Path) -> bool:
     return True
 
 
+# Editors emit several events per save; a path is read once it has been quiet
+# (and its size unchanged) for SETTLE_SECONDS, checked every FLUSH_INTERVAL.
+FLUSH_INTERVAL = 0.2
+SETTLE_SECONDS = 0.15
+
+
+def _file_size(file_path: Path) -> int:
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return -1
+
+
 class TripartiteSensoryHandler(FileSystemEventHandler):
 
+    def __init__(self):
+        super().__init__()
+        # path -> (time of last event, size seen at that event)
+        self._pending: Dict[Path, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+
     def on_modified(self, event):
         if not event.is_directory:
-            self._process_file(Path(event.src_path))
+            self._schedule(Path(event.src_path))
 
     def on_created(self, event):
         if not event.is_directory:
-            self._process_file(Path(event.src_path))
+            self._schedule(Path(event.src_path))
 
-    def _process_file(self, file_path: Path):
+    def _schedule(self, file_path: Path):
         if not should_process(file_path):
             return
+        entry = (time.monotonic(), _file_size(file_path))
+        with self._lock:
+            self._pending[file_path] = entry
 
-        try:
-            # We add a slight delay to ensure file writing is complete before reading
-            time.sleep(0.1)
-
-            # Multi-Modal Boundary: Read raw bytes if audio/data, else text
-            if file_path.suffix.lower() in [".wav", ".dat"]:
-                raw_bytes = file_path.read_bytes()
-                if not raw_bytes:
-                    return
-                # Convert raw bytes to a storable hex string representation for Valkey
-                text = raw_bytes.hex()
-            else:
-                text = file_path.read_text(encoding="utf-8")
-                if not text.strip():
-                    return
-
-            doc_id = str(file_path.relative_to(REPO_ROOT))
+    def _flush_loop(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            now = time.monotonic()
+            with self._lock:
+                due = [
+                    (file_path, entry)
+                    for file_path, entry in self._pending.items()
+                    if now - entry[0] >= SETTLE_SECONDS
+                ]
+            # Stat outside the lock so event callbacks never wait on the sweep
+            sized = [
+                (file_path, entry, _file_size(file_path)) for file_path, entry in due
+            ]
+            ready = []
+            with self._lock:
+                for file_path, entry, current in sized:
+                    if self._pending.get(file_path) is not entry:
+                        # A newer event rescheduled it while we were stat-ing
+                        continue
+                    if current != entry[1]:
+                        # Still being written; wait for another quiet period
+                        self._pending[file_path] = (now, current)
+                        continue
+                    del self._pending[file_path]
+                    ready.append(file_path)
+            if ready:
+                self._process_files(ready)
+
+    def _read_file(self, file_path: Path) -> Optional[str]:
+        # Multi-Modal Boundary: Read raw bytes if audio/data, else text
+        if file_path.suffix.lower() in [".wav", ".dat"]:
+            raw_bytes = file_path.read_bytes()
+            if not raw_bytes:
+                return None
+            # Convert raw bytes to a storable hex string representation for Valkey
+            return raw_bytes.hex()
+        text = file_path.read_text(encoding="utf-8")
+        if not text.strip():
+            return None
+        return text
+
+    def _process_files(self, file_paths: List[Path]):
+        docs: Dict[str, str] = {}
+        for file_path in file_paths:
+            try:
+                text = self._read_file(file_path)
+                if text is None:
+                    continue
+                doc_id = str(file_path.relative_to(REPO_ROOT))
+            except Exception as e:
+                print(f"⚠️ Error ingesting {file_path.name}: {e}")
+                continue
             print(f"👁️ [SENSORY INGESTION] Encoding changes in {doc_id}...")
+            docs[doc_id] = text
 
-            # The encoding and hazard logic is implicitly handled inside the index builder later
-            # For the autonomous layer, we simply push the raw environment bytes to Valkey.
-            # The Tripartite CLI will compute the structural signatures dynamically upon querying,
-            # or the MCP server will rebuild the index. By passing it to Valkey, the engine "knows" it.
+        if not docs:
+            return
+
+        # The encoding and hazard logic is implicitly handled inside the index builder later
+        # For the autonomous layer, we simply push the raw environment bytes to Valkey.
+        # The Tripartite CLI will compute the structural signatures dynamically upon querying,
+        # or the MCP server will rebuild the index. By passing it to Valkey, the engine "knows" it.
+        try:
             if wm.ping():
-                wm.add_document(doc_id, text)
-                print(f"✅ Assimalated {doc_id} into Working Memory.")
+                wm.add_documents(docs)
+                for doc_id in docs:
+                    print(f"✅ Assimalated {doc_id} into Working Memory.")
             else:
                 print("❌ Valkey connection failed. Is sep-valkey running?")
-
         except Exception as e:
-            print(f"⚠️ Error ingesting {file_path.name}: {e}")
+            print(f"⚠️ Error ingesting {len(docs)} file(s): {e}")
 
 
 def main():
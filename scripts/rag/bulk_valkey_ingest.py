@@ -8,8 +8,12 @@ It acts as the "Highway Stress Test" for the Tripartite Daemon architecture.
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -22,6 +26,72 @@ from manifold.valkey_client import ValkeyWorkingMemory
 from manifold.sidecar import encode_text
 from scripts.experiments.manifold_compression_eval import iter_text_documents
 
+OCCURRENCE_FIELDS = (
+    "doc_id",
+    "byte_start",
+    "byte_end",
+    "char_start",
+    "char_end",
+    "hazard",
+    "window_index",
+)
+
+
+def _encode_batch(jobs):
+    """Encode a batch of documents in a worker process.
+
+    Returns only what the merge loop needs: windows as
+    ``(signature, *OCCURRENCE_FIELDS[1:])`` tuples plus the prototype texts.
+    """
+    results = []
+    for doc_id, text, window_bytes, stride_bytes, use_native in jobs:
+        encoded = encode_text(
+            text,
+            window_bytes=window_bytes,
+            stride_bytes=stride_bytes,
+            precision=3,
+            use_native=use_native,
+            hazard_percentile=0.8,
+        )
+        windows = [
+            (
+                w.signature,
+                w.byte_start,
+                w.byte_end,
+                w.char_start,
+                w.char_end,
+                w.hazard,
+                w.window_index,
+            )
+            for w in encoded.windows
+        ]
+        results.append(
+            (doc_id, len(text), len(text.encode("utf-8")), windows, encoded.prototypes)
+        )
+    return results
+
+
+def _iter_encoded(jobs, workers, batch_size=16):
+    """Yield encoded documents in input order, encoding on *workers* processes.
+
+    Only a few batches per worker are kept in flight so huge corpora are not
+    read into memory ahead of the merge loop.
+    """
+    batches = iter(lambda: list(islice(jobs, batch_size)), [])
+    if workers <= 1:
+        for batch in batches:
+            yield from _encode_batch(batch)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for batch in batches:
+            in_flight.append(pool.submit(_encode_batch, batch))
+            if len(in_flight) >= workers * 4:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Bulk Ingest Corpus to Valkey")
@@ -51,6 +121,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--stride-bytes", type=int, default=384, help="Manifold Sliding Window Stride"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Encoder processes (1 encodes in the main process)",
+    )
 
     return parser.parse_args()
 
@@ -80,6 +156,7 @@ def main():
     )
 
     docs_processed = 0
+    next_checkpoint = 100
     total_bytes = 0
     total_windows_encoded = 0
     start_time = time.time()
@@ -101,9 +178,36 @@ def main():
         )
 
     meta = index.meta
-    signatures = index.signatures
     documents = index.documents
 
+    # Per-signature accumulators: hazard stats as [min, max, sum, count] and
+    # occurrences as OCCURRENCE_FIELDS tuples. Both are expanded back into the
+    # index's dict layout only when the graph is serialized.
+    prototypes = {}
+    hazard_stats = {}
+    occurrences = defaultdict(list)
+    for sig, entry in index.signatures.items():
+        haz = entry["hazard"]
+        prototypes[sig] = entry["prototype"]
+        hazard_stats[sig] = [haz["min"], haz["max"], haz["sum"], haz["count"]]
+        occurrences[sig] = [
+            tuple(occ.get(field) for field in OCCURRENCE_FIELDS)
+            for occ in entry["occurrences"]
+        ]
+
+    def build_signatures(with_mean=False):
+        signatures = {}
+        for sig, (h_min, h_max, h_sum, count) in hazard_stats.items():
+            hazard = {"min": h_min, "max": h_max, "sum": h_sum, "count": count}
+            if with_mean:
+                hazard["mean"] = h_sum / count if count else 0.0
+            signatures[sig] = {
+                "prototype": prototypes[sig],
+                "occurrences": [dict(zip(OCCURRENCE_FIELDS, occ)) for occ in occurrences[sig]],
+                "hazard": hazard,
+            }
+        return signatures
+
     def log_progress():
         elapsed = time.time() - start_time
         mbps = (total_bytes / 1024 / 1024) / elapsed if elapsed > 0 else 0
@@ -111,99 +215,76 @@ def main():
         print(
             f"[{elapsed:.1f}s] Docs: {docs_processed} | MBytes: {total_bytes/1024/1024:.2f} ({mbps:.2f} MB/s) | "
             f"Windows: {total_windows_encoded} ({wps:.0f} win/s) | "
-            f"Unique Nodes: {len(signatures)}"
+            f"Unique Nodes: {len(prototypes)}"
         )
 
-    for doc_id, text in iter_text_documents(dataset, json_text_key=args.json_text_key):
-        if args.max_documents is not None and docs_processed >= args.max_documents:
-            break
-
-        byte_len = len(text.encode("utf-8"))
-        total_bytes += byte_len
-
-        # O(N) Native Signature Generation
-        encoded = encode_text(
-            text,
-            window_bytes=args.window_bytes,
-            stride_bytes=args.stride_bytes,
-            precision=3,
-            use_native=args.use_native,
-            hazard_percentile=0.8,
-        )
+    documents_iter = iter_text_documents(dataset, json_text_key=args.json_text_key)
+    if args.max_documents is not None:
+        documents_iter = islice(documents_iter, args.max_documents)
+    jobs = (
+        (doc_id, text, args.window_bytes, args.stride_bytes, args.use_native)
+        for doc_id, text in documents_iter
+    )
 
-        # We don't need to push the raw text to Valkey if we just want to stress test the structural index graph
-        # valkey.add_document(doc_id, text)  # Optional, but consumes more RAM. We will skip for max speed.
+    # We don't need to push the raw text to Valkey if we just want to stress test the structural index graph
+    # valkey.add_document(doc_id, text)  # Optional, but consumes more RAM. We will skip for max speed.
 
-        total_windows_encoded += len(encoded.windows)
+    for doc_id, char_len, byte_len, windows, doc_prototypes in _iter_encoded(jobs, args.workers):
+        total_bytes += byte_len
+        total_windows_encoded += len(windows)
 
         # Accumulate the associative graph
         documents[doc_id] = {
-            "characters": len(text),
+            "characters": char_len,
             "bytes": byte_len,
-            "window_count": len(encoded.windows),
+            "window_count": len(windows),
         }
 
-        for window in encoded.windows:
-            sig = window.signature
-            entry = signatures.get(sig)
-            if entry is None:
-                entry = {
-                    "prototype": {
-                        "text": encoded.prototypes[sig],
-                        "doc_id": doc_id,
-                        "byte_start": window.byte_start,
-                        "byte_end": window.byte_end,
-                        "char_start": window.char_start,
-                        "char_end": window.char_end,
-                    },
-                    "occurrences": [],
-                    "hazard": {
-                        "min": window.hazard,
-                        "max": window.hazard,
-                        "sum": 0.0,
-                        "count": 0,
-                    },
-                }
-                signatures[sig] = entry
-
-            stats = entry["hazard"]
-            stats["count"] += 1
-            stats["sum"] += window.hazard
-            stats["min"] = min(stats["min"], window.hazard)
-            stats["max"] = max(stats["max"], window.hazard)
-
-            entry["occurrences"].append(
-                {
+        for window in windows:
+            sig = window[0]
+            hazard = window[5]
+            stats = hazard_stats.get(sig)
+            if stats is None:
+                prototypes[sig] = {
+                    "text": doc_prototypes[sig],
                     "doc_id": doc_id,
-                    "byte_start": window.byte_start,
-                    "byte_end": window.byte_end,
-                    "char_start": window.char_start,
-                    "char_end": window.char_end,
-                    "hazard": window.hazard,
-                    "window_index": window.window_index,
+                    "byte_start": window[1],
+                    "byte_end": window[2],
+                    "char_start": window[3],
+                    "char_end": window[4],
                 }
-            )
+                hazard_stats[sig] = [hazard, hazard, hazard, 1]
+            else:
+                if hazard < stats[0]:
+                    stats[0] = hazard
+                if hazard > stats[1]:
+                    stats[1] = hazard
+                stats[2] += hazard
+                stats[3] += 1
+
+            occurrences[sig].append((doc_id,) + window[1:])
 
         docs_processed += 1
 
         if docs_processed % 100 == 0:
             log_progress()
-            # Push periodic state back to Valkey
-            meta["total_signatures"] = len(signatures)
+
+        if docs_processed == next_checkpoint:
+            # Each push re-serializes the whole graph, so space checkpoints
+            # geometrically: total checkpoint work stays O(N) instead of O(N^2)
+            next_checkpoint *= 2
+            meta["total_signatures"] = len(prototypes)
             meta["total_windows"] = total_windows_encoded
             meta["documents"] = len(documents)
             index.meta = meta
-            index.signatures = signatures
+            index.signatures = build_signatures()
             index.documents = documents
             valkey.store_cached_index(index)
 
     # Finalize means
-    for entry in signatures.values():
-        haz = entry["hazard"]
-        count = haz["count"]
-        haz["mean"] = haz["sum"] / count if count else 0.0
+    index.signatures = build_signatures(with_mean=True)
 
-    meta["total_signatures"] = len(signatures)
+    meta["total_signatures"] = len(prototypes)
     meta["total_windows"] = total_windows_encoded
     meta["documents"] = len(documents)
 
@@ -0,0 +1,125 @@
+"""Shared plumbing for the background daemons (pair programmer, system sensor).
+
+Holds the keep-alive Ollama session and the watcher_output.txt writer so both
+daemons talk to Ollama and the Gradio UI the same way. Nothing here starts a
+thread at import time; the daemons call start_watcher_log() and warm_ollama()
+from their entry points.
+"""
+
+from __future__ import annotations
+
+import queue
+import sys
+import threading
+from pathlib import Path
+from typing import Optional, TextIO
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+WATCHER_LOG_PATH = REPO_ROOT / "watcher_output.txt"
+
+OLLAMA_URL = "http://localhost:11434/api/generate"
+
+# Keep the model resident between bursts and cap its context (and KV cache);
+# the warm-up must send the same options or Ollama reloads the model
+OLLAMA_MODEL = "llama3:70b"
+OLLAMA_KEEP_ALIVE = "30m"
+OLLAMA_OPTIONS = {"num_ctx": 4096}
+
+_session = None
+
+
+def ollama_session():
+    """One keep-alive session for every Ollama call, so the connection stays warm."""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0),
+        )
+        session.headers.update({"Connection": "keep-alive"})
+        _session = session
+    return _session
+
+
+def warm_ollama() -> None:
+    """Best-effort preload of the model so the first real prompt skips the cold start."""
+
+    def _load():
+        try:
+            ollama_session().post(
+                OLLAMA_URL,
+                json={
+                    "model": OLLAMA_MODEL,
+                    "keep_alive": OLLAMA_KEEP_ALIVE,
+                    "options": OLLAMA_OPTIONS,
+                },
+                timeout=300,
+            )
+        except Exception:
+            pass
+
+    threading.Thread(target=_load, daemon=True).start()
+
+
+# Entries for watcher_output.txt (tailed by the Gradio UI) go through one
+# writer thread that keeps the file open, so result paths never block on it
+_watcher_queue: Optional["queue.Queue[str]"] = None
+
+
+def _drain_watcher_log(log_queue: "queue.Queue[str]", f: TextIO) -> None:
+    while True:
+        entry = log_queue.get()
+        try:
+            f.write(entry)
+        except Exception as exc:
+            print(f"[watcher log] write to {f.name} failed: {exc}", file=sys.stderr)
+
+
+def start_watcher_log(path: Path = WATCHER_LOG_PATH) -> bool:
+    """Open the watcher log and start its writer thread.
+
+    Returns False, after reporting why on stderr, when the file can't be
+    opened; log_watcher() then drops entries (callers print them anyway).
+    """
+    global _watcher_queue
+    if _watcher_queue is not None:
+        return True
+    try:
+        f = open(path, "a", encoding="utf-8", buffering=1)
+    except OSError as exc:
+        print(f"[watcher log] cannot open {path}: {exc}", file=sys.stderr)
+        return False
+    log_queue: "queue.Queue[str]" = queue.Queue()
+    threading.Thread(
+        target=_drain_watcher_log, args=(log_queue, f), daemon=True
+    ).start()
+    _watcher_queue = log_queue
+    return True
+
+
+def log_watcher(entry: str) -> None:
+    """Queue *entry* for watcher_output.txt once start_watcher_log() succeeded."""
+    if _watcher_queue is not None:
+        _watcher_queue.put(entry)
+
+
+def read_head_and_tail(path: Path, size: int, head_bytes: int, tail_bytes: int):
+    """Read the first *head_bytes* and the last *tail_bytes* of a *size*-byte file.
+
+    Returns ``(head, tail)``: raw head bytes and the tail decoded as UTF-8. The
+    tail overlaps the head on files shorter than head_bytes + tail_bytes, so it
+    is always the full last tail_bytes whatever the file size.
+    """
+    with open(path, "rb") as f:
+        head = f.read(head_bytes)
+        start = max(0, size - tail_bytes)
+        if start >= len(head):
+            f.seek(start)
+            tail = f.read()
+        else:
+            tail = head[start:] + f.read()
+    return head, tail.decode("utf-8", errors="replace")
@@ -6,12 +6,16 @@ it triggers the Latent Semantic Adapter to query the local LLM (Ollama) and pre-
 code completions based entirely on spatial motif mappings.
 """
 
+import heapq
+import json
+import os
+import queue
 import sys
 import time
 import threading
 from pathlib import Path
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer  # inotify on Linux, native APIs elsewhere
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(REPO_ROOT) not in sys.path:
@@ -22,46 +26,106 @@ import torch
 torch.set_num_threads(1)
 
 from src.manifold.router import TripartiteRouter
-
-OLLAMA_URL = "http://localhost:11434/api/generate"
-
-
-class PairProgrammerHandler(FileSystemEventHandler):
+from scripts.rag.daemon_support import (
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_MODEL,
+    OLLAMA_OPTIONS,
+    OLLAMA_URL,
+    log_watcher,
+    ollama_session,
+    read_head_and_tail,
+    start_watcher_log,
+    warm_ollama,
+)
+
+# A hazard warning is one sentence; never decode much past that
+MAX_VERDICT_CHARS = 1024
+
+# The active typing window is the last 512 characters; at most 4 UTF-8 bytes
+# each, plus 3 for a character split by the seek.
+ACTIVE_WINDOW_CHARS = 512
+TAIL_BYTES = 4 * ACTIVE_WINDOW_CHARS + 3
+
+# Editors save in bursts (write, temp rename, chmod); events arriving within
+# this window after the first one are coalesced into a single pass.
+COALESCE_SECONDS = 0.15
+
+# Only the source trees are watched recursively, plus the repo root's own *.py
+# files (mcp_server.py, setup.py, ...) non-recursively; .git/, build output and
+# virtualenvs at the repo root never generate events.
+WATCH_DIRS = ("src", "scripts", "tests")
+IGNORE_PATTERNS = ["*/.git/*", "*/build/*", "*/__pycache__/*"]
+
+
+class PairProgrammerHandler(PatternMatchingEventHandler):
     def __init__(self, router: TripartiteRouter):
-        super().__init__()
+        super().__init__(
+            patterns=["*.py"],
+            ignore_patterns=IGNORE_PATTERNS,
+            ignore_directories=True,
+        )
         self.router = router
         self.last_trigger = time.time()
         self.active_window_content = ""
+        # path -> (mtime_ns, size) of the last version processed
+        self._file_cache: dict[str, tuple[int, int]] = {}
+        self._queue: queue.Queue[str] = queue.Queue()
+        self._worker = threading.Thread(target=self._drain_loop, daemon=True)
+        self._worker.start()
+
+    def _drain_loop(self):
+        """Pop queued paths, wait out the save burst, then process each once."""
+        while True:
+            pending = {self._queue.get(): None}
+            time.sleep(COALESCE_SECONDS)
+            while True:
+                try:
+                    pending[self._queue.get_nowait()] = None
+                except queue.Empty:
+                    break
+            for path in pending:
+                self._process_path(path)
 
-    def _process_event(self, event):
-        if event.is_directory or not event.src_path.endswith(".py"):
-            return
-
+    def _process_path(self, path: str):
         # Debounce
         now = time.time()
         if now - self.last_trigger < 3.0:
             return
 
-        filepath = Path(event.src_path)
+        filepath = Path(path)
         try:
-            time.sleep(0.1)  # Wait for flush
-            content = filepath.read_text(encoding="utf-8")
-            if len(content) < 50:
+            from mcp_server import _CHAOS_HEAD_BYTES, _compute_chaos_result
+
+            st = os.stat(filepath)
+            stamp = (st.st_mtime_ns, st.st_size)
+            if self._file_cache.get(path) == stamp:
+                return
+            # Fewer than 50 bytes can't hold 50 characters; skip without opening
+            if st.st_size < 50:
+                return
+
+            # Read only the head (all the chaos profile looks at) and the tail
+            # (the active typing window) instead of the whole file
+            head, tail = read_head_and_tail(
+                filepath, st.st_size, _CHAOS_HEAD_BYTES, TAIL_BYTES
+            )
+            # The tail is the whole file when it is shorter than TAIL_BYTES
+            if len(tail) < 50:
                 return
+            self._file_cache[path] = stamp
 
             print(
                 f"\n[Pair Programmer] Detected structure change in {filepath.name}... Computing FEP Spike."
             )
 
-            # Take the last 512 bytes as the active typing window
-            self.active_window_content = content[-512:]
+            # Take the last 512 characters as the active typing window
+            self.active_window_content = tail[-ACTIVE_WINDOW_CHARS:]
             active_window = self.active_window_content
 
             self.last_trigger = now
             
             # Call analyze_code_chaos logic
-            from mcp_server import _compute_chaos_result
-            chaos = _compute_chaos_result(content.encode("utf-8", errors="replace"))
+            chaos = _compute_chaos_result(head)
             
             if chaos and chaos["collapse_risk"] == "HIGH":
                 print(f"⚠️ WARNING: {filepath.name} is in PERSISTENT_HIGH state (score: {chaos['chaos_score']:.3f}).")
@@ -80,13 +144,7 @@ class PairProgrammerHandler(FileSystemEventHandler):
             if not verified:
                 msg = f"⚡ [FEP Spike | Coverage: {coverage:.2f}%] Pre-generating contextual completion...\n🤖 LLM Suggestion:\n{response}\n"
                 print(msg)
-                try:
-                    with open(
-                        REPO_ROOT / "watcher_output.txt", "a", encoding="utf-8"
-                    ) as f:
-                        f.write(msg + "\n---\n")
-                except Exception:
-                    pass
+                log_watcher(msg + "\n---\n")
             else:
                 print(
                     f"✅ Structural tension low (Coverage: {coverage:.2f}%). No completion needed."
@@ -95,11 +153,57 @@ class PairProgrammerHandler(FileSystemEventHandler):
         except Exception as e:
             print(f"ERROR: {e}")
 
+    def _enqueue(self, event):
+        self._queue.put_nowait(event.src_path)
+
     def on_modified(self, event):
-        self._process_event(event)
+        self._enqueue(event)
 
     def on_created(self, event):
-        self._process_event(event)
+        self._enqueue(event)
+
+
+# Static instructions lead the prompt so Ollama can reuse their KV cache across
+# calls; only the volatile editor state after them needs a fresh prefill
+SELF_CORRECT_PREAMBLE = """You are the Recursive Self-Correction agent. 
+The user represents a biological cortical column. You will be shown the local
+state they are paused on and the active spatial vocabulary bounded to it.
+
+Detect any architectural inconsistencies, type violations, or structural logic errors 
+that the user is about to make or just made. If none, reply EXACTLY with 'SAFE'.
+If you find a hazard, reply with a 'Predictive Hazard Warning:' followed by a 1-sentence warning.
+"""
+
+
+def stream_verdict(prompt: str):
+    """Stream an Ollama completion, hanging up as soon as it opens with SAFE."""
+    buf = ""
+    with ollama_session().post(
+        OLLAMA_URL,
+        json={
+            "model": OLLAMA_MODEL,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": OLLAMA_KEEP_ALIVE,
+            "options": OLLAMA_OPTIONS,
+        },
+        stream=True,
+        timeout=120,
+    ) as response:
+        if response.status_code != 200:
+            return None
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            buf += chunk.get("response", "")
+            if (
+                buf.lstrip().startswith("SAFE")
+                or chunk.get("done")
+                or len(buf) > MAX_VERDICT_CHARS
+            ):
+                break
+    return buf.strip()
 
 
 def recursive_self_correction_loop(handler: PairProgrammerHandler):
@@ -107,19 +211,31 @@ def recursive_self_correction_loop(handler: PairProgrammerHandler):
     Background thread that autonomously probes the Recency Buffer when the user
     stops typing. It hunts for architectural inconsistencies using the heuristic LLM.
     """
+    # The codebook only changes while the handler routes a query (which moves
+    # last_trigger and usually codebook_position), so the Recency Buffer and
+    # its activation tokens are recomputed only after that epoch changes
+    recent_sigs: list = []
+    recent_at = None
+    activation: list = []
+    activation_at = None
     while True:
         time.sleep(1.0)
         now = time.time()
 
         # If the user hasn't typed in 5 seconds and we have an active buffer
         if now - handler.last_trigger > 5.0 and handler.active_window_content:
-            # Sort entries by last_seen to get the true Recency Buffer
-            sorted_entries = sorted(
-                handler.router.codebook.entries.values(),
-                key=lambda e: e.last_seen,
-                reverse=True,
-            )
-            recent_sigs = [e.signature for e in sorted_entries][:50]
+            # Top 50 entries by last_seen are the true Recency Buffer
+            epoch = (handler.last_trigger, handler.router.codebook_position)
+            if epoch != recent_at:
+                recent_sigs = [
+                    e.signature
+                    for e in heapq.nlargest(
+                        50,
+                        handler.router.codebook.entries.values(),
+                        key=lambda e: e.last_seen,
+                    )
+                ]
+                recent_at = epoch
             if len(recent_sigs) < 1:
                 continue
 
@@ -136,95 +252,28 @@ def recursive_self_correction_loop(handler: PairProgrammerHandler):
                 active_tokens = bound_tokens.split(",")
             else:
                 # Use the Dynamic Codebook to find semantic tokens
-                active_tokens = handler.router.codebook.get_activation_buffer(
-                    recent_sigs, 20
-                )
-
-            # Phase 9: Recursive Error Correction (Future Orbit Simulation)
-            import random
-
-            # Use the trailing ~512 bytes of the active window for context
-            context_tail = (
-                handler.active_window_content[-512:]
-                if len(handler.active_window_content) >= 512
-                else handler.active_window_content
-            )
-
-            try:
-                # Simulate 10 Future Orbits to test manifold stability
-                simulated_orbits = []
-                # To simulate perturbative noise without a temperature parameter on the C++ side,
-                # we inject minor whitespace variations into the tail context.
-                for _ in range(10):
-                    jitter = " " * random.randint(0, 3)
-                    test_context = context_tail + jitter
-
-                    # Extract spatial signature proxy (Simulated Manifold extraction for the background daemon)
-                    import hashlib
-
-                    val = int(hashlib.md5(test_context.encode()).hexdigest(), 16)
-                    predicted_signature = (
-                        f"c0.{val % 99}_s0.{(val // 100) % 99}_e0.{(val // 10000) % 99}"
+                if epoch != activation_at:
+                    activation = handler.router.codebook.get_activation_buffer(
+                        recent_sigs, 20
                     )
-                    simulated_orbits.append(predicted_signature)
-
-                features = set(simulated_orbits)
-                # If we get >7 unique signatures from 10 minor perturbations, the manifold is shattered
-                if len(features) > 7:
-                    rupture_msg = f"🛑 **[Three-Body Rupture]** Predictive Chaos detected (Lyapunov proxy: {len(features)/10.0}). Trajectory unstable. Aborting LLM generation to prevent semantic hallucination.\n"
-                    print(rupture_msg)
-                    try:
-                        with open(
-                            REPO_ROOT / "watcher_output.txt", "a", encoding="utf-8"
-                        ) as f:
-                            f.write(rupture_msg + "---\n")
-                    except Exception:
-                        pass
-
-                    # Abort the LLM query as it will likely hallucinate given the high physical entropy
-                    handler.active_window_content = ""
-                    continue
-
-            except Exception as e:
-                print(f"[Orbit Simulation Failed]: {e}")
-                pass
+                    activation_at = epoch
+                active_tokens = activation
 
-            prompt = f"""You are the Recursive Self-Correction agent. 
-The user represents a biological cortical column currently paused on this local state:
+            prompt = f"""{SELF_CORRECT_PREAMBLE}
+The user is currently paused on this local state:
 
 {handler.active_window_content}
 
 The current active spatial vocabulary bounded to this region is:
 {active_tokens}
-
-Detect any architectural inconsistencies, type violations, or structural logic errors 
-that the user is about to make or just made. If none, reply EXACTLY with 'SAFE'.
-If you find a hazard, reply with a 'Predictive Hazard Warning:' followed by a 1-sentence warning.
 """
             try:
-                import requests
-
-                response = requests.post(
-                    "http://localhost:11434/api/generate",
-                    json={
-                        "model": "llama3:70b",
-                        "prompt": prompt,
-                        "stream": False,
-                    },
-                    timeout=120,
-                )
-                if response.status_code == 200:
-                    ans = response.json().get("response", "").strip()
+                ans = stream_verdict(prompt)
+                if ans is not None:
                     if "SAFE" not in ans and len(ans) > 5:
                         msg = f"⚠️ [Predictive Hazard Warning]\n{ans}\n"
                         print(msg)
-                        try:
-                            with open(
-                                REPO_ROOT / "watcher_output.txt", "a", encoding="utf-8"
-                            ) as f:
-                                f.write(msg + "\n---\n")
-                        except Exception:
-                            pass
+                        log_watcher(msg + "\n---\n")
             except Exception:
                 pass
 
@@ -238,13 +287,19 @@ def main():
     if not router.wm.ping():
         print("❌ CRITICAL: Valkey Work Memory is offline.")
         sys.exit(1)
+    start_watcher_log()
+    warm_ollama()
 
-    watch_path = REPO_ROOT
-    print(f"👀 Watching codebase for typing patterns in {watch_path}...")
+    watch_paths = [REPO_ROOT / d for d in WATCH_DIRS if (REPO_ROOT / d).is_dir()]
+    print(
+        f"👀 Watching codebase for typing patterns in {REPO_ROOT} and {', '.join(str(p) for p in watch_paths)}..."
+    )
 
     event_handler = PairProgrammerHandler(router)
     observer = Observer()
-    observer.schedule(event_handler, str(watch_path), recursive=True)
+    observer.schedule(event_handler, str(REPO_ROOT), recursive=False)
+    for watch_path in watch_paths:
+        observer.schedule(event_handler, str(watch_path), recursive=True)
     observer.start()
 
     # Start the true autonomous self-correction loop
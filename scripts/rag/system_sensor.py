@@ -14,11 +14,14 @@ Usage:
     python scripts/rag/system_sensor.py --dmesg
 """
 
+import asyncio
+import os
 import sys
 import time
 import argparse
 import subprocess
-import requests
+from collections import deque
+from itertools import islice
 from pathlib import Path
 
 # Add project root to path
@@ -26,6 +29,25 @@ REPO_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(REPO_ROOT))
 
 from src.manifold.valkey_client import ValkeyWorkingMemory
+from scripts.rag.daemon_support import (
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_MODEL,
+    OLLAMA_OPTIONS,
+    OLLAMA_URL,
+    log_watcher,
+    ollama_session,
+    start_watcher_log,
+    warm_ollama,
+)
+
+# Static instructions lead the prompt so Ollama can reuse their KV cache across
+# calls; only the signature and telemetry after them need a fresh prefill
+PATHOLOGIST_PREAMBLE = """You are the AGI-Lite Systems Pathologist. 
+The O(1) physics engine just detected a Topological Rupture (High Variational Free Energy) in the OS telemetry stream.
+
+Diagnose the trajectory of this system. Is it a memory leak, a runaway thread, an I/O block, or a kernel panic vector?
+Reply with EXACTLY a 2-sentence diagnostic warning. Do not add fluff.
+"""
 
 
 class SystemsPathologist:
@@ -39,9 +61,21 @@ class SystemsPathologist:
                 "Warning: Valkey Working Memory offline. High-speed caching disabled."
             )
 
-        self.telemetry_buffer = []
+        self.telemetry_buffer = deque(maxlen=20)
         # Keep track of history to detect topological ruptures
-        self.orbit_history = []
+        self.orbit_history = deque(maxlen=10)
+        # /proc/[pid]/stat is held open and re-read with pread on every poll
+        self._stat_fd = None
+        # Last 10 kernel messages, fed incrementally from a non-blocking /dev/kmsg
+        self._kmsg_tail = deque(maxlen=10)
+        self._kmsg_fd = None
+        if use_dmesg:
+            try:
+                self._kmsg_fd = os.open("/dev/kmsg", os.O_RDONLY | os.O_NONBLOCK)
+            except OSError:
+                pass  # fall back to spawning dmesg
+        # (context, topology) of the last encode; unchanged telemetry reuses it
+        self._last_topology = None
 
         print(f"🔬 AGI-Lite Systems Pathologist Initialized.")
         if target_pid:
@@ -54,9 +88,11 @@ class SystemsPathologist:
     def _get_proc_stat(self):
         """Read continuous telemetry from /proc/[pid]/stat"""
         try:
-            with open(f"/proc/{self.target_pid}/stat", "r") as f:
-                return f.read().strip()
-        except FileNotFoundError:
+            if self._stat_fd is None:
+                self._stat_fd = os.open(f"/proc/{self.target_pid}/stat", os.O_RDONLY)
+            return os.pread(self._stat_fd, 4096, 0).decode().strip()
+        except (FileNotFoundError, ProcessLookupError):
+            # ENOENT on first open, ESRCH once a held-open process has exited
             print(f"❌ Process {self.target_pid} not found or terminated.")
             sys.exit(1)
         except Exception as e:
@@ -64,6 +100,8 @@ class SystemsPathologist:
 
     def _get_dmesg_tail(self):
         """Read the tail of the kernel ring buffer"""
+        if self._kmsg_fd is not None:
+            return self._read_kmsg_tail()
         try:
             result = subprocess.run(["dmesg", "-t"], capture_output=True, text=True)
             lines = result.stdout.strip().split("\n")
@@ -71,12 +109,28 @@ class SystemsPathologist:
         except Exception as e:
             return str(e)
 
+    def _read_kmsg_tail(self):
+        """Drain new /dev/kmsg records and return the last 10 messages"""
+        while True:
+            try:
+                record = os.read(self._kmsg_fd, 8192)
+            except BlockingIOError:
+                break
+            except BrokenPipeError:
+                continue  # records were overwritten before we read them
+            if not record:
+                break
+            # Record format: "<prio>,<seq>,<usec>,<flags>;<message>\n[ KEY=value\n...]"
+            message = record.partition(b";")[2].split(b"\n", 1)[0]
+            self._kmsg_tail.append(message.decode("utf-8", errors="replace"))
+        return "\n".join(self._kmsg_tail)
+
     def extract_spatial_topology(self, raw_telemetry: str):
         """
         Pass telemetry through the real C++ continuous spatial manifold encoder.
         Extracts physical bounding metrics directly from the temporal byte sequence.
         """
-        from src.manifold.sidecar import encode_text
+        from src.manifold.sidecar import encode_text, parse_signature
 
         # Ensure we have enough data for the engine window
         if len(raw_telemetry.encode("utf-8")) < 256:
@@ -98,13 +152,7 @@ class SystemsPathologist:
             window = encoded.windows[-1]
             sig = window.signature
 
-            # The format is c<coherence>_s<stability>_e<entropy>
-            parts = sig.split("_")
-
-            c = float(parts[0][1:]) if len(parts) > 0 else 0.0
-            s = float(parts[1][1:]) if len(parts) > 1 else 0.0
-            e = float(parts[2][1:]) if len(parts) > 2 else 0.0
-
+            c, s, e = parse_signature(sig) or (0.0, 0.0, 0.0)
             return sig, c, s, e
 
         except Exception as err:
@@ -112,31 +160,45 @@ class SystemsPathologist:
 
     def run_inference_loop(self):
         """Indefinite low-overhead polling loop"""
+        asyncio.run(self.run())
+
+    async def run(self):
+        """Poll telemetry on the event loop, pushing blocking work to threads"""
         poll_interval = 0.5 if self.target_pid else 2.0
+        read_telemetry = (
+            self._get_proc_stat if self.target_pid else self._get_dmesg_tail
+        )
 
         while True:
             # 1. Gather Telemetry
-            data = self._get_proc_stat() if self.target_pid else self._get_dmesg_tail()
+            data = await asyncio.to_thread(read_telemetry)
             if not data:
-                time.sleep(poll_interval)
+                await asyncio.sleep(poll_interval)
                 continue
 
             self.telemetry_buffer.append(data)
-            if len(self.telemetry_buffer) > 20:
-                self.telemetry_buffer.pop(0)
 
             # 2. Extract Topological Manifold (O(1) execution)
-            current_context = "\n".join(self.telemetry_buffer[-5:])
-            sig, c, s, e = self.extract_spatial_topology(current_context)
+            recent = islice(
+                self.telemetry_buffer, max(0, len(self.telemetry_buffer) - 5), None
+            )
+            current_context = "\n".join(recent)
+            if self._last_topology and self._last_topology[0] == current_context:
+                sig, c, s, e = self._last_topology[1]
+            else:
+                sig, c, s, e = await asyncio.to_thread(
+                    self.extract_spatial_topology, current_context
+                )
+                self._last_topology = (current_context, (sig, c, s, e))
 
             # Record orbit
             self.orbit_history.append((c, s, e))
-            if len(self.orbit_history) > 10:
-                self.orbit_history.pop(0)
 
             # 3. Calculate Structural Tension (Variational Free Energy)
             # Tension is high if the current stability deviates widely from the recent orbit mean
             if len(self.orbit_history) == 10:
+                # Ten floats: summing them fresh is cheap and can't drift the
+                # way a running add/subtract total does over a long-lived daemon
                 mean_stability = sum(orb[1] for orb in self.orbit_history) / 10.0
                 structural_tension = abs(s - mean_stability)
 
@@ -160,39 +222,36 @@ class SystemsPathologist:
                         f"⚠️ Operating System trajectory deviating from stable orbit. Waking LLM adapter..."
                     )
 
-                    self.diagnose_anomaly(current_context, sig)
+                    await asyncio.to_thread(self.diagnose_anomaly, current_context, sig)
 
                     # Cool down to prevent API spam
                     print(
                         "\n[Sensor] Cooling down for 10 seconds before resuming O(1) stream..."
                     )
-                    time.sleep(10)
+                    await asyncio.sleep(10)
                     self.orbit_history.clear()
 
-            time.sleep(poll_interval)
+            await asyncio.sleep(poll_interval)
 
     def diagnose_anomaly(self, telemetry: str, signature: str):
         """Invoke the Latent Semantic Adapter to diagnose physical OS ruptures."""
-        prompt = f"""You are the AGI-Lite Systems Pathologist. 
-The O(1) physics engine just detected a Topological Rupture (High Variational Free Energy) in the OS telemetry stream.
-
+        prompt = f"""{PATHOLOGIST_PREAMBLE}
 The current continuous manifold signature is: {signature}
 The raw OS telemetry at the point of rupture is:
 
 {telemetry}
-
-Diagnose the trajectory of this system. Is it a memory leak, a runaway thread, an I/O block, or a kernel panic vector?
-Reply with EXACTLY a 2-sentence diagnostic warning. Do not add fluff.
 """
         print("\n[Pathologist] Querying Llama3-70b via Latent Semantic Adapter...")
         try:
             start = time.time()
-            response = requests.post(
-                "http://localhost:11434/api/generate",
+            response = ollama_session().post(
+                OLLAMA_URL,
                 json={
-                    "model": "llama3:70b",
+                    "model": OLLAMA_MODEL,
                     "prompt": prompt,
                     "stream": False,
+                    "keep_alive": OLLAMA_KEEP_ALIVE,
+                    "options": OLLAMA_OPTIONS,
                 },
                 timeout=30,
             )
@@ -203,13 +262,7 @@ Reply with EXACTLY a 2-sentence diagnostic warning. Do not add fluff.
                 print(msg)
 
                 # Log to the active watcher so it displays in the Gradio UI
-                try:
-                    with open(
-                        REPO_ROOT / "watcher_output.txt", "a", encoding="utf-8"
-                    ) as f:
-                        f.write(msg + "---\n")
-                except Exception:
-                    pass
+                log_watcher(msg + "---\n")
             else:
                 print(f"[Error] LLM Adapter returned {response.status_code}")
         except Exception as e:
@@ -231,6 +284,8 @@ if __name__ == "__main__":
         sys.exit(1)
 
     sensor = SystemsPathologist(target_pid=args.pid, use_dmesg=args.dmesg)
+    start_watcher_log()
+    warm_ollama()
     try:
         sensor.run_inference_loop()
     except KeyboardInterrupt:
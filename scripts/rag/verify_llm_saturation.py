@@ -17,6 +17,12 @@ if str(REPO_ROOT) not in sys.path:
 
 from src.manifold.router import TripartiteRouter
 
+# Philosophical ambiguity appended to a real corpus prefix to collapse its structure
+COLLAPSE_TAIL = (
+    "\n\nAND THEN THE UNIVERSE EXPANDED INTO A KALEIDOSCOPE OF PHILOSOPHICAL EPISTEMOLOGY BEYOND THE TENSION GATE!"
+    * 5
+)
+
 
 def test_fep_saturation(router: TripartiteRouter, query: str) -> None:
     print(f"\n[FEP Saturation Test] Query: '{query}'")
@@ -79,9 +85,7 @@ def main():
     queries = [
         # Query 1: Exactly matches the first 600 bytes to overlap structurally,
         # then collapses rapidly with philosophical ambiguity to trigger the LLM Latent Semantic Adapter.
-        real_text[:600]
-        + "\n\nAND THEN THE UNIVERSE EXPANDED INTO A KALEIDOSCOPE OF PHILOSOPHICAL EPISTEMOLOGY BEYOND THE TENSION GATE!"
-        * 5,
+        "".join((real_text[:600], COLLAPSE_TAIL)),
     ]
 
     for q in queries:
@@ -3,19 +3,23 @@
 #include <pybind11/stl.h>
 
 #include <string>
+#include <string_view>
 #include <vector>
 
 namespace py = pybind11;
 
 std::string analyze_bytes(const py::bytes &input_bytes, size_t window_bytes,
                           size_t step_bytes, int signature_precision) {
-  std::string str_bytes = static_cast<std::string>(input_bytes);
-  std::vector<uint8_t> bytes(str_bytes.begin(), str_bytes.end());
+  // Copy straight out of the bytes object's buffer (no intermediate string)
+  std::string_view view = input_bytes;
+  std::vector<uint8_t> bytes(view.begin(), view.end());
   sep::ByteStreamConfig config;
   config.window_bits = window_bytes * 8;
   config.step_bits = std::max<size_t>(1, step_bytes * 8);
   config.signature_precision = signature_precision;
 
+  // The analysis touches no Python objects; let other threads run meanwhile.
+  py::gil_scoped_release release;
   sep::ByteStreamManifold manifold = sep::analyze_byte_stream(bytes, config);
   return manifold.to_json(config).dump();
 }
@@ -7,9 +7,20 @@ calculate how many files would be impacted by changes to a given file.
 from __future__ import annotations
 
 import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # numba not installed; blast radius uses the numpy BFS
 
 
 @dataclass
@@ -24,6 +35,95 @@ class DependencyInfo:
     is_core: bool = False  # True if many files depend on this
 
 
+# Statement-list fields: imports can only appear inside these, never in expressions
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _collect_imports(body: List[ast.stmt], imports: Set[str]) -> None:
+    """Add the modules imported anywhere in *body* to *imports*.
+
+    Only statement blocks (if/try/with/def/class/match bodies and handlers) are
+    descended into, so expression nodes are never visited.
+    """
+    stack = list(body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                # Keep full module path for accurate dependency tracking
+                imports.add(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                # Handle relative imports properly
+                prefix = "." * node.level if node.level > 0 else ""
+                imports.add(f"{prefix}{node.module}")
+        else:
+            for name in _BLOCK_FIELDS:
+                block = getattr(node, name, None)
+                if isinstance(block, list):
+                    stack.extend(block)
+
+
+def _bfs_count(indptr, indices, start, visited, stack) -> int:
+    """Count the files reachable from *start* over CSR importer edges.
+
+    A plain integer loop over preallocated buffers (*visited* all False,
+    *stack* at least one slot per file), compiled with numba when available.
+    """
+    visited[start] = True
+    stack[0] = start
+    top = 1
+    count = 0
+    while top:
+        top -= 1
+        node = stack[top]
+        for k in range(indptr[node], indptr[node + 1]):
+            importer = indices[k]
+            if not visited[importer]:
+                visited[importer] = True
+                stack[top] = importer
+                top += 1
+                count += 1
+    return count
+
+
+if njit is not None:
+    _bfs_count = njit(cache=True)(_bfs_count)
+
+
+def _extract_imports_from(file_path: str) -> Set[str]:
+    """Extract all imports from a Python file.
+
+    Module-level so it can run in ProcessPoolExecutor workers.
+
+    Args:
+        file_path: Path to the Python file
+
+    Returns:
+        Set of imported module names (full paths, not truncated)
+    """
+    imports = set()
+
+    try:
+        # Raw bytes: ast.parse decodes them itself, honouring PEP 263 cookies
+        with open(file_path, "rb") as f:
+            source = f.read()
+
+        # Both import forms contain the keyword; without it there is nothing
+        # to parse for
+        if b"import" not in source:
+            return imports
+
+        tree = ast.parse(source, filename=file_path)
+        _collect_imports(tree.body, imports)
+
+    except (SyntaxError, UnicodeDecodeError, ValueError, OSError):
+        # Skip files that can't be parsed
+        pass
+
+    return imports
+
+
 class ASTDependencyAnalyzer:
     """Analyze Python AST to compute dependency graphs and blast radius."""
 
@@ -36,6 +136,8 @@ class ASTDependencyAnalyzer:
         self.repo_root = Path(repo_root)
         self.dependencies: Dict[str, DependencyInfo] = {}
         self.module_to_file: Dict[str, str] = {}  # Map module names to file paths
+        # imported_by as CSR arrays (ids, indptr, indices), built on first use
+        self._csr: Optional[Tuple[Dict[str, int], Any, Any]] = None
 
     def _extract_imports(self, file_path: Path) -> Set[str]:
         """Extract all imports from a Python file.
@@ -46,28 +148,7 @@ class ASTDependencyAnalyzer:
         Returns:
             Set of imported module names (full paths, not truncated)
         """
-        imports = set()
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        # Keep full module path for accurate dependency tracking
-                        imports.add(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        # Handle relative imports properly
-                        prefix = "." * node.level if node.level > 0 else ""
-                        imports.add(f"{prefix}{node.module}")
-
-        except (SyntaxError, UnicodeDecodeError, OSError):
-            # Skip files that can't be parsed
-            pass
-
-        return imports
+        return _extract_imports_from(str(file_path))
 
     def _file_to_module(self, file_path: Path) -> str:
         """Convert a file path to a module name.
@@ -110,6 +191,9 @@ class ASTDependencyAnalyzer:
         "site-packages",
     }
 
+    # Below this many files the parse runs inline; process start-up would dominate
+    PARALLEL_MIN_FILES = 64
+
     def build_dependency_graph(self, file_pattern: str = "**/*.py") -> None:
         """Build the complete dependency graph for the repository.
 
@@ -120,37 +204,47 @@ class ASTDependencyAnalyzer:
         py_files = [
             p
             for p in self.repo_root.glob(file_pattern)
-            if not any(skip in p.parts for skip in self.SKIP_DIRS)
+            if not any(skip in p.parts for skip in self.SKIP_DIRS) and p.is_file()
         ]
 
         # Build module name mapping
         for py_file in py_files:
-            if py_file.is_file():
-                module_name = self._file_to_module(py_file)
-                rel_path = str(py_file.relative_to(self.repo_root))
-                self.module_to_file[module_name] = rel_path
-
-                # Also register package names for directories with __init__.py
-                if py_file.name == "__init__.py":
-                    package_name = (
-                        module_name.rsplit(".", 1)[0]
-                        if "." in module_name
-                        else module_name
+            module_name = self._file_to_module(py_file)
+            rel_path = str(py_file.relative_to(self.repo_root))
+            self.module_to_file[module_name] = rel_path
+
+            # Also register package names for directories with __init__.py
+            if py_file.name == "__init__.py":
+                package_name = (
+                    module_name.rsplit(".", 1)[0] if "." in module_name else module_name
+                )
+                self.module_to_file[package_name] = rel_path
+
+        # Extract imports for each file; ast.parse is GIL-bound, so large
+        # repositories parse across processes
+        all_imports = None
+        if len(py_files) >= self.PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            try:
+                with ProcessPoolExecutor() as pool:
+                    all_imports = list(
+                        pool.map(
+                            _extract_imports_from, map(str, py_files), chunksize=16
+                        )
                     )
-                    self.module_to_file[package_name] = rel_path
-
-        # Extract imports for each file
-        for py_file in py_files:
-            if not py_file.is_file():
-                continue
+            except (OSError, BrokenProcessPool):
+                all_imports = None
+        if all_imports is None:
+            all_imports = [self._extract_imports(p) for p in py_files]
 
+        for py_file, imports in zip(py_files, all_imports):
             rel_path = str(py_file.relative_to(self.repo_root))
-            imports = self._extract_imports(py_file)
 
             self.dependencies[rel_path] = DependencyInfo(
                 file_path=rel_path, imports=imports
             )
 
+        partial_matches = self._partial_module_index()
+
         # Build reverse dependencies (imported_by)
         for file_path, dep_info in self.dependencies.items():
             for imported_module in dep_info.imports:
@@ -162,16 +256,33 @@ class ASTDependencyAnalyzer:
                     target_file = self.module_to_file[imported_module]
                 else:
                     # Try partial matches for relative imports
-                    for mod_name, mod_file in self.module_to_file.items():
-                        if mod_name.startswith(
-                            imported_module + "."
-                        ) or mod_name.endswith("." + imported_module):
-                            target_file = mod_file
-                            break
+                    target_file = partial_matches.get(imported_module)
 
                 if target_file and target_file in self.dependencies:
                     self.dependencies[target_file].imported_by.add(file_path)
 
+        self._csr = None
+
+    def _partial_module_index(self) -> Dict[str, str]:
+        """Index module_to_file by every dotted prefix and suffix of its names.
+
+        A module name ``a.b.c`` is reachable as ``a``, ``a.b`` (it starts with
+        ``name + "."``) and as ``b.c``, ``c`` (it ends with ``"." + name``). Each
+        key keeps the first entry in module_to_file order, the one a linear
+        scan would have stopped at, so a partial lookup is one dict get.
+
+        Returns:
+            Mapping of partial module name to file path
+        """
+        index: Dict[str, str] = {}
+        for mod_name, mod_file in self.module_to_file.items():
+            dot = mod_name.find(".")
+            while dot >= 0:
+                index.setdefault(mod_name[:dot], mod_file)
+                index.setdefault(mod_name[dot + 1 :], mod_file)
+                dot = mod_name.find(".", dot + 1)
+        return index
+
     def compute_blast_radius(self, file_path: str) -> int:
         """Compute the blast radius for a file.
 
@@ -187,61 +298,204 @@ class ASTDependencyAnalyzer:
         if file_path not in self.dependencies:
             return 0
 
-        visited = set()
-        to_visit = [file_path]
+        import numpy as np
 
-        while to_visit:
-            current = to_visit.pop()
-            if current in visited:
-                continue
+        ids, indptr, indices = self._importer_csr()
 
-            visited.add(current)
+        if njit is not None:
+            return _bfs_count(
+                indptr,
+                indices,
+                ids[file_path],
+                np.zeros(len(ids), dtype=np.bool_),
+                np.empty(len(ids), dtype=np.int32),
+            )
 
-            if current in self.dependencies:
-                # Add all files that import this one
-                for importer in self.dependencies[current].imported_by:
-                    if importer not in visited:
-                        to_visit.append(importer)
+        # Level-synchronous BFS: each step gathers the importers of the whole
+        # frontier with one fancy-index into the CSR edge array
+        visited = np.zeros(len(ids), dtype=bool)
+        frontier = np.array([ids[file_path]], dtype=np.int32)
+        visited[frontier] = True
+
+        while frontier.size:
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+            importers = indices[offsets + np.arange(offsets.size)]
+            frontier = np.unique(importers[~visited[importers]])
+            visited[frontier] = True
 
         # Subtract 1 to exclude the file itself
-        return len(visited) - 1
+        return int(np.count_nonzero(visited)) - 1
+
+    def _importer_csr(self) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
+        """The imported_by relation as CSR arrays over dense file ids.
+
+        Importers of file ``i`` are ``indices[indptr[i]:indptr[i + 1]]``: two
+        int32 arrays instead of a Python set per file.
+
+        Returns:
+            Tuple of (file id by path, indptr, indices)
+        """
+        if self._csr is None:
+            import numpy as np
+
+            ids = {fp: i for i, fp in enumerate(self.dependencies)}
+            indptr = np.zeros(len(ids) + 1, dtype=np.int32)
+            indptr[1:] = np.cumsum(
+                [len(info.imported_by) for info in self.dependencies.values()]
+            )
+            indices = np.fromiter(
+                (
+                    ids[importer]
+                    for info in self.dependencies.values()
+                    for importer in info.imported_by
+                ),
+                dtype=np.int32,
+                count=int(indptr[-1]),
+            )
+            self._csr = (ids, indptr, indices)
+        return self._csr
 
     def compute_dependency_depth(self, file_path: str) -> int:
         """Compute the maximum dependency chain depth for a file.
 
+        An import cycle counts as a single level, and every file in it has
+        the same depth (see _compute_depths).
+
         Args:
             file_path: Relative path to the file
 
         Returns:
             Maximum depth of dependency chains
         """
-        if file_path not in self.dependencies:
-            return 0
+        return self._compute_depths([file_path]).get(file_path, 0)
 
-        def _depth_recursive(fp: str, visited: Set[str]) -> int:
-            if fp in visited:
-                return 0
+    def _compute_depths(self, roots) -> Dict[str, int]:
+        """Longest importer chain below each file reachable from *roots*.
 
-            visited.add(fp)
+        Depths are taken over the import-cycle components from _condense(), so
+        every file in a cycle shares one depth and an edge inside a cycle counts
+        as a single step. A file's depth therefore doesn't depend on where the
+        walk started: compute_dependency_depth() and analyze_all() agree.
 
-            if fp not in self.dependencies:
-                return 0
+        Args:
+            roots: Relative paths to start from
 
-            max_depth = 0
-            for importer in self.dependencies[fp].imported_by:
-                depth = 1 + _depth_recursive(importer, visited.copy())
-                max_depth = max(max_depth, depth)
+        Returns:
+            Mapping of relative path to dependency depth
+        """
+        comp_of, components = self._condense(roots)
+        depth: List[int] = []
+        for comp, members in enumerate(components):
+            longest = 0
+            for member in members:
+                for importer in self.dependencies[member].imported_by:
+                    other = comp_of[importer]
+                    longest = max(longest, 1 if other == comp else 1 + depth[other])
+            depth.append(longest)
+
+        return {fp: depth[comp] for fp, comp in comp_of.items()}
+
+    def _compute_blast_radii(self) -> Dict[str, int]:
+        """Blast radius of every file in one pass over the graph.
+
+        Each import-cycle component from _condense() comes after every
+        component it reaches, so its reachable set is its own members OR-ed
+        with its successors' finished sets. Sets are int bitmasks with one bit
+        per file, so a union is a single big-int OR and the count is
+        int.bit_count().
+
+        Returns:
+            Mapping of relative path to blast radius
+        """
+        bit = {fp: 1 << i for i, fp in enumerate(self.dependencies)}
+        comp_of, components = self._condense(self.dependencies)
+        reach: List[int] = []
+        for comp, members in enumerate(components):
+            mask = 0
+            for member in members:
+                mask |= bit[member]
+                for importer in self.dependencies[member].imported_by:
+                    other = comp_of[importer]
+                    if other != comp:
+                        mask |= reach[other]
+            reach.append(mask)
+
+        # Subtract 1 to exclude the file itself
+        return {fp: reach[comp_of[fp]].bit_count() - 1 for fp in self.dependencies}
+
+    def _condense(self, roots) -> Tuple[Dict[str, int], List[List[str]]]:
+        """Import cycles reachable from *roots*, collapsed into components.
+
+        An iterative Tarjan walk over the imported_by edges. Tarjan finishes a
+        strongly connected component only after every component it reaches,
+        so components come out in an order where each one's successors are
+        already listed.
 
-            return max_depth
+        Args:
+            roots: Relative paths to start from
+
+        Returns:
+            Tuple of (component number by path, members of each component)
+        """
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        scc_stack: List[str] = []
+        comp_of: Dict[str, int] = {}
+        components: List[List[str]] = []
+
+        for root in roots:
+            if root in index or root not in self.dependencies:
+                continue
+
+            index[root] = low[root] = len(index)
+            scc_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.dependencies[root].imported_by))]
+            while work:
+                fp, importers = work[-1]
+                for importer in importers:
+                    if importer not in index:
+                        index[importer] = low[importer] = len(index)
+                        scc_stack.append(importer)
+                        on_stack.add(importer)
+                        work.append(
+                            (importer, iter(self.dependencies[importer].imported_by))
+                        )
+                        break
+                    if importer in on_stack:
+                        low[fp] = min(low[fp], index[importer])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[fp])
+                    if low[fp] != index[fp]:
+                        continue
+
+                    # fp roots a component: pop its members off the stack
+                    members = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        comp_of[member] = len(components)
+                        members.append(member)
+                        if member == fp:
+                            break
+                    components.append(members)
 
-        return _depth_recursive(file_path, set())
+        return comp_of, components
 
     def analyze_all(self) -> None:
         """Compute blast radius and depth for all files in the graph."""
+        blast_radii = self._compute_blast_radii()
+        depths = self._compute_depths(self.dependencies)
         for file_path in self.dependencies:
             dep_info = self.dependencies[file_path]
-            dep_info.blast_radius = self.compute_blast_radius(file_path)
-            dep_info.depth = self.compute_dependency_depth(file_path)
+            dep_info.blast_radius = blast_radii[file_path]
+            dep_info.depth = depths[file_path]
             dep_info.is_core = dep_info.blast_radius > 5  # Arbitrary threshold
 
     def get_high_impact_files(
@@ -0,0 +1,48 @@
+"""Binary encoding of the per-file chaos profiles stored in Valkey.
+
+Chaos profiles are stored as a fixed 32-byte record: chaos_score, entropy,
+coherence (float64), collapse_risk index and windows_analyzed (uint32).
+Indexes built before the packed format hold zstd-compressed JSON instead.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Dict
+
+import orjson
+import zstandard as zstd
+
+CHAOS_STRUCT = struct.Struct("<dddII")
+RISK_LEVELS = ("LOW", "MODERATE", "HIGH")
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Shared across calls; constructing a decompressor per profile is not free
+_DCTX = zstd.ZstdDecompressor()
+
+
+def encode_chaos(chaos: Dict) -> bytes:
+    """Pack a chaos profile dict into its stored binary form."""
+    return CHAOS_STRUCT.pack(
+        chaos["chaos_score"],
+        chaos["entropy"],
+        chaos["coherence"],
+        RISK_LEVELS.index(chaos["collapse_risk"]),
+        chaos["windows_analyzed"],
+    )
+
+
+def decode_chaos(raw: bytes) -> Dict:
+    """Decode a stored ``chaos`` field into its profile dict."""
+    if len(raw) != CHAOS_STRUCT.size:
+        if raw[:4] == _ZSTD_MAGIC:
+            raw = _DCTX.decompress(raw)
+        return orjson.loads(raw)
+    score, entropy, coherence, risk, windows = CHAOS_STRUCT.unpack(raw)
+    return {
+        "chaos_score": score,
+        "entropy": entropy,
+        "coherence": coherence,
+        "collapse_risk": RISK_LEVELS[risk],
+        "windows_analyzed": windows,
+    }
@@ -3,13 +3,29 @@
 from __future__ import annotations
 
 import json
+import re
 import subprocess
 from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, MutableMapping, Sequence, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
 
 FORMAT_VERSION = "1"
+_SIGNATURE_RE = re.compile(r"c([^_]*)_s([^_]*)_e([^_]*)")
 
 
 @dataclass
@@ -139,6 +155,27 @@ class VerificationResult:
         return payload
 
 
+_ENGINE = None
+
+
+def _load_engine():
+    """Import the native manifold_engine extension once and reuse it."""
+    global _ENGINE
+    if _ENGINE is None:
+        try:
+            import manifold_engine
+        except ImportError:
+            # Fallback for when running in raw source checkout (where setup.py placed it in src/)
+            import sys
+
+            src_path = str(Path(__file__).resolve().parent.parent)
+            if src_path not in sys.path:
+                sys.path.insert(0, src_path)
+            import manifold_engine
+        _ENGINE = manifold_engine
+    return _ENGINE
+
+
 def _build_byte_index(text: str) -> List[int]:
     offsets = [0]
     for ch in text:
@@ -241,6 +278,15 @@ def iter_text_documents(
     yield root.stem, root.read_text(encoding="utf-8")
 
 
+def parse_signature(signature: str) -> Optional[Tuple[float, float, float]]:
+    """Split a ``c<coherence>_s<stability>_e<entropy>`` signature into floats."""
+    match = _SIGNATURE_RE.fullmatch(signature)
+    if match is None:
+        return None
+    c, s, e = match.groups()
+    return float(c), float(s), float(e)
+
+
 def sliding_windows(
     data: bytes, window_bytes: int, stride_bytes: int
 ) -> Iterable[Tuple[int, bytes]]:
@@ -270,7 +316,8 @@ def encode_text(
     """
 
     text_bytes = text.encode("utf-8")
-    byte_index = _build_byte_index(text)
+    # Pure-ASCII text (the common case for code) has char == byte offsets
+    byte_index = _build_byte_index(text) if len(text_bytes) != len(text) else None
 
     windows: List[EncodedWindow] = []
     prototypes: Dict[str, str] = {}
@@ -290,18 +337,7 @@ def encode_text(
         )
 
     try:
-        try:
-            import manifold_engine
-        except ImportError:
-            # Fallback for when running in raw source checkout (where setup.py placed it in src/)
-            import sys
-
-            src_path = str(Path(__file__).resolve().parent.parent)
-            if src_path not in sys.path:
-                sys.path.insert(0, src_path)
-            import manifold_engine
-
-        json_str = manifold_engine.analyze_bytes(
+        json_str = _load_engine().analyze_bytes(
             text_bytes, window_bytes, stride_bytes, precision
         )
     except Exception as e:
@@ -320,8 +356,11 @@ def encode_text(
         coherence = float(metrics.get("coherence", 0.0))
         byte_start = int(w.get("offset_bytes", 0))
         byte_end = min(byte_start + window_bytes, len(text_bytes))
-        char_start = _byte_to_char(byte_start, byte_index)
-        char_end = _byte_to_char(byte_end, byte_index)
+        if byte_index is None:
+            char_start, char_end = byte_start, byte_end
+        else:
+            char_start = _byte_to_char(byte_start, byte_index)
+            char_end = _byte_to_char(byte_end, byte_index)
         window_index = int(w.get("index", 0))
 
         windows.append(
@@ -363,6 +402,54 @@ def encode_text(
     )
 
 
+def encode_text_arrays(
+    text: str,
+    window_bytes: int = 512,
+    stride_bytes: int = 384,
+    precision: int = 3,
+) -> Dict[str, "np.ndarray"]:
+    """Encode text into per-window metric columns for numeric consumers.
+
+    Returns ``hazard``, ``entropy``, ``coherence`` and ``byte_start`` arrays
+    without building EncodedWindow objects, prototypes or char offsets, so it
+    stays cheap on files far larger than a few windows.
+    """
+    import numpy as np
+
+    text_bytes = text.encode("utf-8")
+    windows: List[Mapping[str, object]] = []
+    if text_bytes:
+        try:
+            json_str = _load_engine().analyze_bytes(
+                text_bytes, window_bytes, stride_bytes, precision
+            )
+        except Exception as e:
+            raise RuntimeError(f"manifold_engine native execution failed: {e}")
+        try:
+            windows = json.loads(json_str).get("windows", [])
+        except json.JSONDecodeError:
+            windows = []
+
+    rows = []
+    for w in windows:
+        metrics = w.get("metrics", {})
+        rows.append(
+            (
+                w.get("lambda_hazard", 0.0),
+                metrics.get("entropy", 0.0),
+                metrics.get("coherence", 0.0),
+                w.get("offset_bytes", 0),
+            )
+        )
+    table = np.array(rows, dtype=np.float64).reshape(-1, 4)
+    return {
+        "hazard": table[:, 0],
+        "entropy": table[:, 1],
+        "coherence": table[:, 2],
+        "byte_start": table[:, 3].astype(np.int64),
+    }
+
+
 def encode_text_to_windows(
     text: str,
     window_bytes: int = 512,
@@ -605,6 +692,21 @@ def reconstruct_from_windows(
     return result.decode("utf-8", errors="replace")
 
 
+def _scoped_occurrences(
+    entry: object, path_filter: Callable[[str], bool] | None
+) -> List[object]:
+    occurrences = entry.get("occurrences", []) if isinstance(entry, dict) else []
+    if not isinstance(occurrences, list):
+        return []
+    if path_filter is None:
+        return occurrences
+    return [
+        occ
+        for occ in occurrences
+        if isinstance(occ, dict) and path_filter(occ.get("doc_id"))
+    ]
+
+
 def verify_snippet(
     text: str,
     index: ManifoldIndex | Mapping[str, object],
@@ -616,10 +718,13 @@ def verify_snippet(
     precision: int | None = None,
     use_native: bool = False,
     include_reconstruction: bool = False,
+    path_filter: Callable[[str], bool] | None = None,
 ) -> VerificationResult:
     """Verify a snippet by matching signatures and gating by hazard.
 
     Coverage = low-hazard matched windows / total windows. Uses hazard gate from index unless overridden.
+    When *path_filter* is given, only occurrences whose doc_id passes it count as matches, so callers
+    can scope verification without building a filtered copy of the index.
     """
 
     meta = (
@@ -665,6 +770,9 @@ def verify_snippet(
         )
         if not entry:
             continue
+        occurrences = _scoped_occurrences(entry, path_filter)
+        if path_filter is not None and not occurrences:
+            continue
 
         matched_windows += 1
         matches.append(
@@ -682,11 +790,9 @@ def verify_snippet(
         if window.hazard <= hazard_threshold:
             gated_hits += 1
 
-        occurrences = entry.get("occurrences", []) if isinstance(entry, dict) else []
-        if isinstance(occurrences, list):
-            for occ in occurrences:
-                if isinstance(occ, dict) and "doc_id" in occ:
-                    matched_documents.add(str(occ["doc_id"]))
+        for occ in occurrences:
+            if isinstance(occ, dict) and "doc_id" in occ:
+                matched_documents.add(str(occ["doc_id"]))
 
     coverage = gated_hits / total_windows if total_windows else 0.0
     match_ratio = len(matches) / total_windows if total_windows else 0.0
@@ -698,6 +804,7 @@ def verify_snippet(
             for sig, sig_entry in (
                 signatures.items() if isinstance(signatures, dict) else []
             )
+            if path_filter is None or _scoped_occurrences(sig_entry, path_filter)
         }
         reconstruction = reconstruct_from_windows(encoded.windows, prototypes)
 
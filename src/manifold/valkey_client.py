@@ -1,12 +1,23 @@
+import os
 import valkey
 import json
 import zstandard as zstd
 import base64
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, Mapping, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .sidecar import ManifoldIndex
 
+_TRUTHY = {"1", "true", "yes", "on"}
+
+# Shared across calls; constructing a decompressor per document is not free
+_DCTX = zstd.ZstdDecompressor()
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _decompress(data: bytes) -> bytes:
+    return _DCTX.decompress(data)
+
 
 class ValkeyWorkingMemory:
     """
@@ -14,11 +25,32 @@ class ValkeyWorkingMemory:
     Replaces the ephemeral IN_MEMORY_DOCS dictionary.
     """
 
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0):
-        self.r = valkey.Redis(host=host, port=port, db=db, decode_responses=True)
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        client_cache: Optional[bool] = None,
+    ):
+        # Opt-in RESP3 client-side caching: server-assisted CLIENT TRACKING keeps
+        # an in-process mirror of small reads (sig/chaos HGETs, meta, ZSCOREs)
+        # that Valkey invalidates via push messages whenever a key changes.
+        if client_cache is None:
+            client_cache = os.environ.get("MANIFOLD_CLIENT_CACHE", "") in _TRUTHY
+        cache_kwargs = (
+            {"protocol": 3, "cache_enabled": True, "cache_max_size": 100_000}
+            if client_cache
+            else {}
+        )
+        self.r = valkey.Redis(
+            host=host, port=port, db=db, decode_responses=True, **cache_kwargs
+        )
         # Persistent raw byte connection to avoid N+1 initialization overhead
         kwargs = self.r.connection_pool.connection_kwargs.copy()
         kwargs["decode_responses"] = False
+        # Raw reads are whole compressed documents; keep them out of the cache
+        kwargs["cache_enabled"] = False
+        kwargs["client_cache"] = None
         self.raw_r = valkey.Redis(**kwargs)
         self.doc_prefix = "manifold:docs:"
         self.index_key = "manifold:active_index"
@@ -36,6 +68,16 @@ class ValkeyWorkingMemory:
         self.r.set(f"{self.doc_prefix}{doc_id}", text)
         self.invalidate_index()
 
+    def add_documents(self, docs: Mapping[str, str]) -> None:
+        """Store many documents and invalidate the index in one round trip."""
+        if not docs:
+            return
+        pipe = self.r.pipeline(transaction=False)
+        for doc_id, text in docs.items():
+            pipe.set(f"{self.doc_prefix}{doc_id}", text)
+        pipe.delete(self.index_key, self.semantic_index_key)
+        pipe.execute()
+
     def remove_document(self, doc_id: str) -> None:
         """Remove a stored document from Valkey."""
         self.r.delete(f"{self.doc_prefix}{doc_id}")
@@ -70,11 +112,11 @@ class ValkeyWorkingMemory:
                 if not raw:
                     continue
 
-                # Assume it's compressed using the MCP server mechanism
-                try:
-                    ctx = zstd.ZstdDecompressor()
-                    content = ctx.decompress(raw).decode("utf-8")
-                except Exception:
+                # Compressed docs carry the zstd frame magic; skip the failed
+                # decompress on raw placeholders instead of catching it
+                if raw[:4] == _ZSTD_MAGIC:
+                    content = _decompress(raw).decode("utf-8", errors="replace")
+                else:
                     content = raw.decode("utf-8", errors="replace")
 
                 docs[doc_id] = content
@@ -100,8 +142,7 @@ class ValkeyWorkingMemory:
         # Decode base64 -> decompress zstd -> decode utf-8 -> parse json
         try:
             compressed = base64.b64decode(b64_data)
-            ctx = zstd.ZstdDecompressor()
-            json_str = ctx.decompress(compressed).decode("utf-8", errors="replace")
+            json_str = _decompress(compressed).decode("utf-8", errors="replace")
             parsed = json.loads(json_str)
         except Exception as e:
             print(f"Failed to load cached index: {e}")
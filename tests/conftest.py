@@ -33,3 +33,11 @@ if INIT_FILE.exists():
             module.__path__ = [str(SCRIPTS_PATH)]  # type: ignore[attr-defined]
             sys.modules["scripts"] = module
             spec.loader.exec_module(module)
+
+
+def pytest_configure(config):
+    # Registered here so the mark is harmless when pytest-xdist isn't installed
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run on a single xdist worker with --dist=loadgroup",
+    )
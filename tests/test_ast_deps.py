@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from src.manifold.ast_deps import ASTDependencyAnalyzer, DependencyInfo
+
+# file -> files that import it. a/b/c/d is a diamond (d imports b and c, both
+# import a); x and y import each other, z imports x and w imports y.
+IMPORTED_BY = {
+    "a.py": {"b.py", "c.py"},
+    "b.py": {"d.py"},
+    "c.py": {"d.py"},
+    "d.py": set(),
+    "x.py": {"y.py", "z.py"},
+    "y.py": {"x.py", "w.py"},
+    "z.py": set(),
+    "w.py": set(),
+}
+
+EXPECTED = {
+    # file: (blast_radius, depth)
+    "a.py": (3, 2),
+    "b.py": (1, 1),
+    "c.py": (1, 1),
+    "d.py": (0, 0),
+    "x.py": (3, 1),
+    "y.py": (3, 1),
+    "z.py": (0, 0),
+    "w.py": (0, 0),
+}
+
+
+@pytest.fixture
+def analyzer() -> ASTDependencyAnalyzer:
+    a = ASTDependencyAnalyzer(Path("/nonexistent"))
+    for fp, importers in IMPORTED_BY.items():
+        a.dependencies[fp] = DependencyInfo(fp, imported_by=set(importers))
+    return a
+
+
+def test_analyze_all_diamond_and_cycle(analyzer: ASTDependencyAnalyzer):
+    analyzer.analyze_all()
+    got = {
+        fp: (info.blast_radius, info.depth)
+        for fp, info in analyzer.dependencies.items()
+    }
+    assert got == EXPECTED
+
+
+@pytest.mark.parametrize("fp", sorted(EXPECTED))
+def test_single_file_matches_analyze_all(analyzer: ASTDependencyAnalyzer, fp: str):
+    """Per-file results don't depend on where the walk starts, even in a cycle."""
+    assert analyzer.compute_blast_radius(fp) == EXPECTED[fp][0]
+    assert analyzer.compute_dependency_depth(fp) == EXPECTED[fp][1]
+
+
+def test_import_cycle_counts_as_one_level():
+    a = ASTDependencyAnalyzer(Path("/nonexistent"))
+    for fp, importer in (("p.py", "q.py"), ("q.py", "r.py"), ("r.py", "p.py")):
+        a.dependencies[fp] = DependencyInfo(fp, imported_by={importer})
+    a.analyze_all()
+    assert {fp: info.depth for fp, info in a.dependencies.items()} == {
+        "p.py": 1,
+        "q.py": 1,
+        "r.py": 1,
+    }
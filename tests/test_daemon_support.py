@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import pytest
+
+from scripts.rag.daemon_support import read_head_and_tail
+
+HEAD_BYTES = 16384
+TAIL_BYTES = 4 * 512 + 3
+
+
+def _write(tmp_path: Path, size: int) -> bytes:
+    data = bytes(ord("a") + i % 26 for i in range(size))
+    (tmp_path / "f.py").write_bytes(data)
+    return data
+
+
+@pytest.mark.parametrize(
+    "size",
+    [
+        100,
+        HEAD_BYTES,
+        HEAD_BYTES + 1,
+        HEAD_BYTES + 16,
+        HEAD_BYTES + TAIL_BYTES - 1,
+        HEAD_BYTES + TAIL_BYTES,
+        HEAD_BYTES + TAIL_BYTES + 1,
+        40_000,
+    ],
+)
+def test_read_head_and_tail(tmp_path: Path, size: int):
+    data = _write(tmp_path, size)
+    head, tail = read_head_and_tail(tmp_path / "f.py", size, HEAD_BYTES, TAIL_BYTES)
+    assert head == data[:HEAD_BYTES]
+    assert tail == data[-TAIL_BYTES:].decode()
+
+
+def test_tail_spanning_head_keeps_full_window(tmp_path: Path):
+    """Files just past the head still yield a full 512-character window."""
+    size = HEAD_BYTES + 16
+    data = _write(tmp_path, size)
+    _, tail = read_head_and_tail(tmp_path / "f.py", size, HEAD_BYTES, TAIL_BYTES)
+    assert tail[-512:] == data[-512:].decode()
+    assert len(tail[-512:]) == 512
@@ -25,7 +25,9 @@ Tool inventory (must match @mcp.tool() decorators in mcp_server.py):
 
 from __future__ import annotations
 
+import functools
 import re
+import threading
 import time
 from pathlib import Path
 
@@ -40,9 +42,11 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+import mcp_server
 from mcp_server import (
     analyze_blast_radius,
     analyze_code_chaos,
+    batch_analyze_code_chaos,
     batch_chaos_scan,
     cluster_codebase_structure,
     compute_combined_risk,
@@ -67,57 +71,56 @@ from mcp_server import (
 # ---------------------------------------------------------------------------
 # Shared constants & test data
 # ---------------------------------------------------------------------------
-TOOL_COUNT = 21  # Must match the number of @mcp.tool() decorators
+TOOL_COUNT = 22  # Must match the number of @mcp.tool() decorators
 
 # A realistic Python snippet ≥512 bytes for signature/verification tests
-SAMPLE_CODE = (
-    '"""Wrapper utilities for structural manifold encoding."""\n'
-    "\n"
-    "from __future__ import annotations\n"
-    "\n"
-    "from pathlib import Path\n"
-    "from typing import Dict, Optional\n"
-    "\n"
-    "import numpy as np\n"
-    "\n"
-    "from .metrics import (\n"
-    "    compute_coherence,\n"
-    "    compute_entropy,\n"
-    "    compute_hazard,\n"
-    ")\n"
-    "\n"
-    "class ManifoldEncoder:\n"
-    "    def __init__(self, precision: int = 3, hazard_threshold: float = 0.5):\n"
-    "        self.precision = precision\n"
-    "        self.hazard_threshold = hazard_threshold\n"
-    "\n"
-    "    def encode_chunk(self, chunk: bytes) -> str:\n"
-    "        if len(chunk) < 512:\n"
-    '            raise ValueError("Chunk must be at least 512 bytes")\n'
-    "        \n"
-    "        coh = compute_coherence(chunk)\n"
-    "        ent = compute_entropy(chunk)\n"
-    "        haz = compute_hazard(chunk, coh, ent)\n"
-    "        \n"
-    '        return f"c{coh:.{self.precision}f}_s{1.0 - ent:.{self.precision}f}_e{ent:.{self.precision}f}"\n'
-    "\n"
-    "def build_index(\n"
-    "    repo_path: Path,\n"
-    "    max_documents: int = 1000,\n"
-    ") -> Dict[str, str]:\n"
-    '    """Build a structural search index.\n'
-    "    \n"
-    "    Args:\n"
-    "        repo_path: Path to codebase\n"
-    "        max_documents: Stop after this many files\n"
-    '    """\n'
-    "    from .crawler import crawl_repo\n"
-    "    return crawl_repo(\n"
-    "        repo_path,\n"
-    "        max_documents=max_documents,\n"
-    "    )\n"
+SAMPLE_CODE = r'''"""Wrapper utilities for structural manifold encoding."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from .metrics import (
+    compute_coherence,
+    compute_entropy,
+    compute_hazard,
 )
 
+class ManifoldEncoder:
+    def __init__(self, precision: int = 3, hazard_threshold: float = 0.5):
+        self.precision = precision
+        self.hazard_threshold = hazard_threshold
+
+    def encode_chunk(self, chunk: bytes) -> str:
+        if len(chunk) < 512:
+            raise ValueError("Chunk must be at least 512 bytes")
+        
+        coh = compute_coherence(chunk)
+        ent = compute_entropy(chunk)
+        haz = compute_hazard(chunk, coh, ent)
+        
+        return f"c{coh:.{self.precision}f}_s{1.0 - ent:.{self.precision}f}_e{ent:.{self.precision}f}"
+
+def build_index(
+    repo_path: Path,
+    max_documents: int = 1000,
+) -> Dict[str, str]:
+    """Build a structural search index.
+    
+    Args:
+        repo_path: Path to codebase
+        max_documents: Stop after this many files
+    """
+    from .crawler import crawl_repo
+    return crawl_repo(
+        repo_path,
+        max_documents=max_documents,
+    )
+'''
+
 INJECT_FACT_ID = f"__test_fact_{int(time.time())}"
 FACT_QUERY = "test fact injected by the MCP tool validation suite"
 INJECT_FACT_TEXT = (
@@ -130,9 +133,17 @@ INJECT_FACT_TEXT = (
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
+_SIG_RE = re.compile(r"c[\d.]+_s[\d.]+_e[\d.]+")
+
+
+@functools.lru_cache(maxsize=None)
+def _field_re(label: str) -> re.Pattern[str]:
+    return re.compile(rf"{re.escape(label)}[^:\n]*:\s*([\d.]+)")
+
+
 def _parse_signature(output: str) -> str | None:
     """Extract a cX.XXX_sX.XXX_eX.XXX signature from tool output."""
-    m = re.search(r"c[\d.]+_s[\d.]+_e[\d.]+", output)
+    m = _SIG_RE.search(output)
     return m.group(0) if m else None
 
 
@@ -142,10 +153,16 @@ def _parse_float_field(output: str, label: str) -> float | None:
     Tolerates extra text between the label and the colon (e.g.
     'Chaos Score (fluctuation_persistence) : 0.399').
     """
-    m = re.search(rf"{re.escape(label)}[^:\n]*:\s*([\d.]+)", output)
+    m = _field_re(label).search(output)
     return float(m.group(1)) if m else None
 
 
+# Tests that write to the index or the shared test_watcher_dir. Under
+# ``pytest -n auto --dist=loadgroup`` they all run on one worker, in order,
+# while the read-only tests spread across the rest.
+mutating = pytest.mark.xdist_group("mutating")
+
+
 # ---------------------------------------------------------------------------
 # Module-scoped fixture: ensure repo is ingested once before all tests
 # ---------------------------------------------------------------------------
@@ -153,11 +170,37 @@ def _parse_float_field(output: str, label: str) -> float | None:
 def ensure_ingested():
     """Ingest the repository before running any tests in this module."""
     result = ingest_repo(
-        root_dir=str(REPO_ROOT), compute_chaos=True, clear_first=False, lite=True
+        root_dir=str(REPO_ROOT),
+        compute_chaos=True,
+        clear_first=False,
+        lite=True,
+        incremental=True,
     )
     assert "✅" in result, f"Ingest failed: {result}"
 
 
+@pytest.fixture(scope="module")
+def server_signature(ensure_ingested):
+    """get_file_signature output for mcp_server.py, fetched once per module."""
+    return get_file_signature("mcp_server.py")
+
+
+@pytest.fixture(scope="module")
+def server_dashboard(ensure_ingested):
+    """visualize_manifold_trajectory output for mcp_server.py, rendered once.
+
+    The committed dashboard is deleted first and a render that outlives the
+    tool's wait is awaited, so the HTML checks only see this run's output.
+    """
+    (REPO_ROOT / "reports" / "manifold_trajectory_mcp_server.py.html").unlink(
+        missing_ok=True
+    )
+    result = visualize_manifold_trajectory("mcp_server.py")
+    for future in list(mcp_server._pending_renders.values()):
+        future.result()
+    return result
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # 1. INDEXING & MONITORING
 # ═══════════════════════════════════════════════════════════════════════════
@@ -166,20 +209,54 @@ def ensure_ingested():
 class TestIndexingAndMonitoring:
     """Validate the indexing pipeline and monitoring tools."""
 
+    @mutating
     def test_ingest_repo_output_structure(self):
         """Verify ingest output contains all expected metrics."""
         result = ingest_repo(
-            root_dir=str(REPO_ROOT), compute_chaos=True, clear_first=False, lite=True
+            root_dir=str(REPO_ROOT),
+            compute_chaos=True,
+            clear_first=False,
+            lite=True,
+            incremental=True,
         )
         assert "✅ Ingest complete" in result
-        for field in [
-            "Text files",
-            "Binary files",
-            "Signatures",
-            "Avg chaos",
-            "High-risk",
-        ]:
-            assert field in result, f"Missing field '{field}' in ingest output"
+        missing = [
+            m
+            for m in (
+                "Text files",
+                "Binary files",
+                "Signatures",
+                "Unchanged",
+                "Avg chaos",
+                "High-risk",
+            )
+            if m not in result
+        ]
+        assert not missing, f"Missing {missing} in ingest output"
+
+    @mutating
+    def test_incremental_ingest_honours_lite(self):
+        """An unchanged file is re-scored when the lite setting changes."""
+        target = "tests/test_mcp_tools.py"
+        assert f"| {target}" not in batch_chaos_scan(pattern=target, max_files=5)
+        try:
+            ingest_repo(
+                root_dir=str(REPO_ROOT),
+                compute_chaos=True,
+                clear_first=False,
+                lite=False,
+                incremental=True,
+            )
+            assert f"| {target}" in batch_chaos_scan(pattern=target, max_files=5)
+        finally:
+            ingest_repo(
+                root_dir=str(REPO_ROOT),
+                compute_chaos=True,
+                clear_first=False,
+                lite=True,
+                incremental=True,
+            )
+        assert f"| {target}" not in batch_chaos_scan(pattern=target, max_files=5)
 
     def test_ingest_repo_nonexistent_directory(self):
         """Ingest on a missing directory returns an error."""
@@ -190,15 +267,19 @@ class TestIndexingAndMonitoring:
         """Verify stats output contains all key metrics."""
         result = get_index_stats()
         assert "❌" not in result, f"Stats failed: {result}"
-        for field in [
-            "Total Valkey keys",
-            "Indexed documents",
-            "Structural sigs",
-            "Chaos profiles",
-            "Valkey memory",
-            "Encoder available",
-        ]:
-            assert field in result, f"Missing field '{field}' in stats output"
+        missing = [
+            m
+            for m in (
+                "Total Valkey keys",
+                "Indexed documents",
+                "Structural sigs",
+                "Chaos profiles",
+                "Valkey memory",
+                "Encoder available",
+            )
+            if m not in result
+        ]
+        assert not missing, f"Missing {missing} in stats output"
 
     def test_get_index_stats_has_documents(self):
         """After ingest, document count should be > 0."""
@@ -211,6 +292,7 @@ class TestIndexingAndMonitoring:
         result = start_watcher(watch_dir="non_existent_fake_dir_12345")
         assert "❌" in result
 
+    @mutating
     def test_start_watcher_real_dir(self):
         """Watcher can start on a valid directory."""
         test_dir = Path("test_watcher_dir")
@@ -281,9 +363,9 @@ class TestSearchAndRetrieval:
         result = get_file("nonexistent_file_12345.py")
         assert "not found" in result.lower()
 
-    def test_get_file_signature_format(self):
+    def test_get_file_signature_format(self, server_signature):
         """File signature is in cX.XXX_sX.XXX_eX.XXX format."""
-        result = get_file_signature("mcp_server.py")
+        result = server_signature
         if "❌" not in result:
             sig = _parse_signature(result)
             assert sig is not None, f"Could not parse signature from: {result}"
@@ -295,9 +377,9 @@ class TestSearchAndRetrieval:
                     0.0 <= val <= 1.0
                 ), f"Signature component {part} out of [0,1] range"
 
-    def test_search_by_structure_finds_self(self):
+    def test_search_by_structure_finds_self(self, server_signature):
         """Searching by a file's own signature should find itself."""
-        sig_result = get_file_signature("mcp_server.py")
+        sig_result = server_signature
         if "❌" in sig_result:
             pytest.skip("Signature unavailable for mcp_server.py")
 
@@ -408,14 +490,18 @@ class TestChaosDetection:
         assert "❌" not in result, f"Chaos analysis failed: {result}"
 
         # Verify all metric labels present
-        for label in [
-            "Chaos Score",
-            "Entropy",
-            "Coherence",
-            "Collapse Risk",
-            "Windows analyzed",
-        ]:
-            assert label in result, f"Missing '{label}' in chaos output"
+        missing = [
+            m
+            for m in (
+                "Chaos Score",
+                "Entropy",
+                "Coherence",
+                "Collapse Risk",
+                "Windows analyzed",
+            )
+            if m not in result
+        ]
+        assert not missing, f"Missing {missing} in chaos output"
 
         # Parse metrics — note: output uses "Chaos Score (fluctuation_persistence) : 0.399"
         # The _parse_float_field helper tolerates extra text before the colon
@@ -433,6 +519,22 @@ class TestChaosDetection:
         result = analyze_code_chaos("nonexistent_file_99999.py")
         assert "❌" in result
 
+    def test_batch_analyze_code_chaos_matches_single(self):
+        """Batch analysis reports the same score as the per-file tool, in order."""
+        single = analyze_code_chaos("mcp_server.py")
+        result = batch_analyze_code_chaos(
+            ["mcp_server.py", "nonexistent_file_99999.py"]
+        )
+        assert "Batch Chaos Analysis (2 files)" in result
+        lines = [l for l in result.splitlines() if "|" in l]
+        assert lines[0].endswith("| mcp_server.py")
+        assert f"{_parse_float_field(single, 'Chaos Score'):.3f}" in lines[0]
+        assert "❌" in lines[1] and lines[1].endswith("nonexistent_file_99999.py")
+
+    def test_batch_analyze_code_chaos_empty(self):
+        """Batch analysis with no paths returns an error."""
+        assert "❌" in batch_analyze_code_chaos([])
+
     def test_batch_chaos_scan_structure(self):
         """Batch scan returns ranked results."""
         result = batch_chaos_scan(pattern="*.py", max_files=5)
@@ -447,6 +549,24 @@ class TestChaosDetection:
         assert isinstance(full_scan, str)
         assert isinstance(scoped_scan, str)
 
+    @mutating
+    def test_batch_chaos_scan_drops_removed_file(self):
+        """A removed file no longer appears in the chaos ranking."""
+        target = "scripts/rag/verify_latency.py"
+        assert f"| {target}" in batch_chaos_scan(pattern=target, max_files=5)
+        try:
+            remove_fact(target)
+            assert f"| {target}" not in batch_chaos_scan(pattern=target, max_files=5)
+        finally:
+            ingest_repo(
+                root_dir=str(REPO_ROOT),
+                compute_chaos=True,
+                clear_first=False,
+                lite=True,
+                incremental=True,
+            )
+        assert f"| {target}" in batch_chaos_scan(pattern=target, max_files=5)
+
     def test_predict_structural_ejection_states(self):
         """Ejection prediction returns one of the three symbolic states."""
         result = predict_structural_ejection("mcp_server.py", horizon_days=30)
@@ -464,11 +584,11 @@ class TestChaosDetection:
         result = predict_structural_ejection("nonexistent_file_99999.py")
         assert "❌" in result
 
-    def test_visualize_manifold_trajectory_creates_html(self):
+    def test_visualize_manifold_trajectory_creates_html(self, server_dashboard):
         """Visualization generates a valid HTML dashboard."""
-        result = visualize_manifold_trajectory("mcp_server.py")
+        result = server_dashboard
         assert "❌" not in result, f"Visualization failed: {result}"
-        assert "4-Panel Manifold Dashboard saved to:" in result
+        assert re.search(r"4-Panel Manifold Dashboard (saved|rendering) to:", result)
 
         # Verify file was created
         reports_dir = REPO_ROOT / "reports"
@@ -477,34 +597,41 @@ class TestChaosDetection:
 
         # Verify file is non-trivial (>10 KB indicates real plot data)
         for html in htmls:
-            assert (
-                html.stat().st_size > 10_000
-            ), f"HTML too small ({html.stat().st_size} bytes)"
+            size = html.stat().st_size
+            assert size > 10_000, f"HTML too small ({size} bytes)"
 
-    def test_visualize_manifold_trajectory_output_metrics(self):
+    def test_visualize_manifold_trajectory_output_metrics(self, server_dashboard):
         """Dashboard output contains all expected metric labels."""
-        result = visualize_manifold_trajectory("mcp_server.py")
-        for label in [
-            "Windows analyzed",
-            "Avg Chaos Score",
-            "Max Chaos Score",
-            "Avg Entropy",
-            "Avg Coherence",
-            "Collapse Risk",
-            "LOW_FLUCTUATION",
-            "OSCILLATION",
-            "PERSISTENT_HIGH",
-        ]:
-            assert label in result, f"Missing '{label}' in dashboard output"
+        result = server_dashboard
+        missing = [
+            m
+            for m in (
+                "Windows analyzed",
+                "Avg Chaos Score",
+                "Max Chaos Score",
+                "Avg Entropy",
+                "Avg Coherence",
+                "Collapse Risk",
+                "LOW_FLUCTUATION",
+                "OSCILLATION",
+                "PERSISTENT_HIGH",
+            )
+            if m not in result
+        ]
+        assert not missing, f"Missing {missing} in dashboard output"
 
         # Verify the four panel descriptions are referenced
-        for panel in [
-            "Physical Evolution",
-            "Manifold Attractors",
-            "3D Phase Space Trajectory",
-            "Structural Phase Space",
-        ]:
-            assert panel in result, f"Missing panel description '{panel}'"
+        missing = [
+            m
+            for m in (
+                "Physical Evolution",
+                "Manifold Attractors",
+                "3D Phase Space Trajectory",
+                "Structural Phase Space",
+            )
+            if m not in result
+        ]
+        assert not missing, f"Missing panel descriptions {missing}"
 
     def test_cluster_codebase_structure_basic(self):
         """Clustering produces labeled groups."""
@@ -532,14 +659,18 @@ class TestDependencyAndRisk:
         """Blast radius analysis returns all expected fields."""
         result = analyze_blast_radius("mcp_server.py")
         assert "❌" not in result, f"Blast radius failed: {result}"
-        for field in [
-            "Blast Radius",
-            "Dependency Depth",
-            "Is Core Module",
-            "Imports",
-            "Imported By",
-        ]:
-            assert field in result, f"Missing '{field}' in blast radius output"
+        missing = [
+            m
+            for m in (
+                "Blast Radius",
+                "Dependency Depth",
+                "Is Core Module",
+                "Imports",
+                "Imported By",
+            )
+            if m not in result
+        ]
+        assert not missing, f"Missing {missing} in blast radius output"
 
     def test_analyze_blast_radius_nonexistent(self):
         """Blast radius on a nonexistent file returns error."""
@@ -550,14 +681,18 @@ class TestDependencyAndRisk:
         """Combined risk returns score, level, and formula."""
         result = compute_combined_risk("mcp_server.py")
         assert "❌" not in result, f"Combined risk failed: {result}"
-        for field in [
-            "Combined Risk",
-            "Risk Level",
-            "Formula",
-            "Chaos Score",
-            "Blast Radius",
-        ]:
-            assert field in result, f"Missing '{field}' in combined risk output"
+        missing = [
+            m
+            for m in (
+                "Combined Risk",
+                "Risk Level",
+                "Formula",
+                "Chaos Score",
+                "Blast Radius",
+            )
+            if m not in result
+        ]
+        assert not missing, f"Missing {missing} in combined risk output"
 
     def test_compute_combined_risk_levels(self):
         """Risk level is one of the four defined categories."""
@@ -589,9 +724,17 @@ class TestDependencyAndRisk:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@mutating
 class TestWorkingMemory:
     """Validate zero-shot fact injection and removal lifecycle."""
 
+    @pytest.fixture(autouse=True)
+    def clean_fact(self):
+        """Start and finish each test with the test fact absent from the index."""
+        remove_fact(INJECT_FACT_ID)
+        yield
+        remove_fact(INJECT_FACT_ID)
+
     def test_inject_and_search_fact(self):
         """Injected fact is discoverable via search_code."""
         inject_res = inject_fact(INJECT_FACT_ID, INJECT_FACT_TEXT)
@@ -619,6 +762,7 @@ class TestWorkingMemory:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@mutating
 class TestWatcherIntegration:
     """Validate the filesystem watcher lifecycle."""
 
@@ -650,6 +794,21 @@ class TestWatcherIntegration:
             if test_dir.exists():
                 test_dir.rmdir()
 
+    def test_stopped_watcher_ends_flusher(self):
+        """Stopping the observer ends its flusher; start_watcher starts afresh."""
+        start_watcher()
+        observer = mcp_server._active_observer
+        observer.stop()
+        observer.join(timeout=5)
+        time.sleep(0.5)  # flusher polls every 0.2 s
+        flushers = [
+            t for t in threading.enumerate() if t.name == "manifold-watch-flush"
+        ]
+        assert not flushers, "flusher outlived its observer"
+
+        assert "started" in start_watcher().lower()
+        assert mcp_server._active_observer is not observer
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 8. META: TOOL INVENTORY VERIFICATION
@@ -664,6 +823,7 @@ class TestToolInventory:
         imported_tools = [
             analyze_blast_radius,
             analyze_code_chaos,
+            batch_analyze_code_chaos,
             batch_chaos_scan,
             cluster_codebase_structure,
             compute_combined_risk,
@@ -694,6 +854,7 @@ class TestToolInventory:
         tools = [
             analyze_blast_radius,
             analyze_code_chaos,
+            batch_analyze_code_chaos,
             batch_chaos_scan,
             cluster_codebase_structure,
             compute_combined_risk,
@@ -2,7 +2,13 @@ from pathlib import Path
 
 import json
 
-from manifold.sidecar import build_index, encode_text, verify_snippet
+from manifold.sidecar import (
+    build_index,
+    encode_text,
+    encode_text_arrays,
+    parse_signature,
+    verify_snippet,
+)
 
 
 def _load_docs(corpus: Path) -> dict[str, str]:
@@ -78,3 +84,42 @@ def test_index_serialization_includes_version(tmp_path: Path) -> None:
     payload = index.to_dict()
     assert payload.get("format_version") == "1"
     assert "hazard_threshold" in payload
+
+
+def test_verify_snippet_path_filter_scopes_matches(tmp_path: Path) -> None:
+    corpus_path = _write_corpus(tmp_path)
+    docs = _load_docs(corpus_path)
+    index = build_index(
+        docs,
+        window_bytes=32,
+        stride_bytes=16,
+        precision=2,
+        hazard_percentile=0.8,
+    )
+    kwargs = dict(window_bytes=32, stride_bytes=16, precision=2, coverage_threshold=0.0)
+
+    unscoped = verify_snippet("alpha beta gamma alpha", index, **kwargs)
+    scoped = verify_snippet("alpha beta gamma alpha", index, path_filter={"doc2"}.__contains__, **kwargs)
+    excluded = verify_snippet("alpha beta gamma alpha", index, path_filter=lambda doc_id: False, **kwargs)
+
+    assert set(scoped.matched_documents) <= {"doc2"}
+    assert scoped.match_ratio <= unscoped.match_ratio
+    assert excluded.match_ratio == 0
+    assert not excluded.matched_documents
+
+
+def test_encode_text_arrays_matches_encode_text() -> None:
+    text = "alpha beta gamma delta epsilon " * 4
+    encoded = encode_text(text, window_bytes=16, stride_bytes=8, precision=2)
+    columns = encode_text_arrays(text, window_bytes=16, stride_bytes=8, precision=2)
+
+    assert len(columns["hazard"]) == len(encoded.windows)
+    assert list(columns["byte_start"]) == [w.byte_start for w in encoded.windows]
+    assert list(columns["entropy"]) == [w.entropy for w in encoded.windows]
+    assert list(columns["coherence"]) == [w.coherence for w in encoded.windows]
+    assert len(encode_text_arrays("")["hazard"]) == 0
+
+
+def test_parse_signature() -> None:
+    assert parse_signature("c0.445_s0.000_e0.934") == (0.445, 0.0, 0.934)
+    assert parse_signature("c1_s2") is None
@@ -17,7 +17,8 @@ except ImportError:
     print("Error: Please install pandas and plotly: pip install pandas plotly")
     sys.exit(1)
 
-from mcp_server import _get_valkey, FILE_HASH_PREFIX, _decompress
+from mcp_server import _get_valkey, FILE_HASH_PREFIX
+from src.manifold.chaos_codec import decode_chaos
 
 
 def generate_3d_plot(pattern="*"):
@@ -58,17 +59,7 @@ def generate_3d_plot(pattern="*"):
             chaos = 0.0
             if raw_chaos:
                 try:
-                    js_bytes = _decompress(raw_chaos)
-                    js = js_bytes.decode("utf-8", errors="replace")
-                except Exception:
-                    js = (
-                        raw_chaos.decode("utf-8", errors="replace")
-                        if isinstance(raw_chaos, bytes)
-                        else str(raw_chaos)
-                    )
-                try:
-                    chaos_data = json.loads(js)
-                    chaos = float(chaos_data.get("chaos_score", 0.0))
+                    chaos = float(decode_chaos(raw_chaos).get("chaos_score", 0.0))
                 except json.JSONDecodeError:
                     pass
 